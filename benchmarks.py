@@ -0,0 +1,388 @@
+# Відтворюваний бенчмарк усіх завдань з порівнянням із збереженим baseline.
+
+"""
+Як запустити
+У терміналі з папки проєкту:
+
+python benchmarks.py                                   # усі навантаження, результат у bench_results.json
+python benchmarks.py --filter task_6 --repeat 7        # лише навантаження, назва яких містить task_6
+python benchmarks.py --update-baseline                 # зберегти поточні числа як baseline
+python benchmarks.py --baseline benchmarks_baseline.json --tolerance 0.25 --min-delta 0.005
+
+Кожне навантаження параметризоване (розмір, рівень, бюджет...) і має фіксований seed.
+Перед замірами — один прогрівочний виклик, під час замірів GC вимкнено.
+Порівнюється медіана з --repeat запусків; якщо вона гірша за baseline більш ніж на tolerance
+(частка) і водночас більш ніж на --min-delta секунд, навантаження вважається регресією
+і скрипт завершується з кодом 1.
+Навантаження, залежності яких не встановлені, позначаються як skipped.
+Baseline (benchmarks_baseline.json) прив'язаний до машини, тому в репозиторій не комітиться:
+запишіть його локально через --update-baseline перед змінами і порівнюйте після. Разом із
+часами зберігається meta середовища (версія Python, реалізація, ОС, модель процесора й
+кількість ядер); якщо вона не збігається з поточною машиною, порівняння пропускається
+з попередженням.
+Навантаження import.<модуль> міряють час імпорту в чистому підпроцесі та перевіряють,
+що matplotlib/numpy/networkx при цьому не завантажуються.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# name -> (setup, params); setup(param) готує дані й повертає функцію без аргументів, яку і міряю
+WORKLOADS: Dict[str, tuple] = {}
+
+
+def workload(name: str, params: list):
+    """Декоратор: реєструє навантаження name для кожного значення з params."""
+    def register(setup: Callable):
+        WORKLOADS[name] = (setup, params)
+        return setup
+    return register
+
+
+# task_1: однозв'язний список
+@workload("task_1.build", [500, 1000, 2000])
+def _linked_list_build(n):
+    from task_1 import LinkedList
+    data = random.Random(1).sample(range(n * 10), n)
+    return lambda: LinkedList(data)
+
+
+@workload("task_1.sort", [10_000, 50_000, 200_000])
+def _linked_list_sort(n):
+    from task_1 import LinkedList, Node
+    data = random.Random(1).sample(range(n * 10), n)
+
+    def run():
+        # будую список через insert_at_beginning (O(n)), щоб міряти саме сортування
+        ll = LinkedList()
+        for x in data:
+            node = Node(x)
+            node.next = ll.head
+            ll.head = node
+        ll.sort()
+    return run
+
+
+@workload("task_1.merge", [10_000, 100_000])
+def _linked_list_merge(n):
+    from task_1 import LinkedList, Node, merge_two_sorted_lists
+
+    def build(values):
+        ll = LinkedList()
+        for x in reversed(values):
+            node = Node(x)
+            node.next = ll.head
+            ll.head = node
+        return ll
+
+    evens, odds = list(range(0, 2 * n, 2)), list(range(1, 2 * n, 2))
+    return lambda: merge_two_sorted_lists(build(evens), build(odds))
+
+
+# task_2: геометрія дерева Піфагора
+@workload("task_2.squares", [8, 12, 14])
+def _pythagoras(level):
+    from task_2 import pythagoras_squares
+    return lambda: sum(1 for _ in pythagoras_squares(complex(-0.5, 0), complex(1, 0), level))
+
+
+# task_3: Дейкстра
+def grid_graph(side: int, seed: int = 3):
+    """Неорієнтована сітка side x side з випадковими вагами 1..10."""
+    from task_3 import Graph
+    rng = random.Random(seed)
+    g = Graph(directed=False)
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            if c + 1 < side:
+                g.add_edge(v, v + 1, rng.randint(1, 10))
+            if r + 1 < side:
+                g.add_edge(v, v + side, rng.randint(1, 10))
+    return g
+
+
+def random_graph(n: int, avg_degree: int = 8, seed: int = 3):
+    """Орієнтований випадковий граф з n вершинами і ~n * avg_degree ребрами."""
+    from task_3 import Graph
+    rng = random.Random(seed)
+    g = Graph(directed=True)
+    for v in range(n):
+        g.add_edge(v, (v + 1) % n, rng.random())  # кільце — щоб усе було досяжно
+        for _ in range(avg_degree - 1):
+            g.add_edge(v, rng.randrange(n), rng.random() * 10)
+    return g
+
+
+@workload("task_3.dijkstra_grid", [50, 100, 200])
+def _dijkstra_grid(side):
+    from task_3 import dijkstra_heap
+    g = grid_graph(side)
+    return lambda: dijkstra_heap(g, 0)
+
+
+@workload("task_3.dijkstra_random", [1_000, 10_000, 50_000])
+def _dijkstra_random(n):
+    from task_3 import dijkstra_heap
+    g = random_graph(n)
+    return lambda: dijkstra_heap(g, 0)
+
+
+# task_4 / task_5: купа і дерево на масивах
+@workload("task_4.heap_layout", [1_000, 100_000, 1_000_000])
+def _heap_layout(n):
+    import heapq
+    from compact_tree import CompactTree
+    data = random.Random(4).sample(range(n * 10), n)
+
+    def run():
+        heap = data[:]
+        heapq.heapify(heap)
+        CompactTree.from_heap(heap).layout()
+    return run
+
+
+@workload("task_5.tree_layout", [1_000, 50_000, 200_000])
+def _tree_layout(n):
+    from compact_tree import CompactTree
+    from task_5 import build_tree
+    root = build_tree(n, "balanced")
+    return lambda: CompactTree.from_node(root).layout()
+
+
+@workload("task_5.traversal", [10_000, 100_000])
+def _traversal(n):
+    from task_5 import bfs_iter, build_tree, inorder_iter
+    root = build_tree(n, "balanced")
+
+    def run():
+        for _ in bfs_iter(root):
+            pass
+        for _ in inorder_iter(root):
+            pass
+    return run
+
+
+# task_6: рюкзак
+@workload("task_6.dp", [(50, 1_000), (100, 5_000), (200, 10_000)])
+def _knapsack(param):
+    from task_6 import dynamic_programming, random_menu
+    n, budget = param
+    menu = random_menu(n)
+    return lambda: dynamic_programming(menu, budget)
+
+
+@workload("task_6.greedy", [1_000, 100_000])
+def _greedy(n):
+    from task_6 import greedy_algorithm, random_menu
+    menu = random_menu(n)
+    return lambda: greedy_algorithm(menu, 500)
+
+
+# task_7: Монте-Карло
+@workload("task_7.simulate", [10_000, 100_000, 500_000])
+def _simulate(trials):
+    from task_7 import simulate
+    return lambda: simulate(trials, seed=42)
+
+
+# Час імпорту модулів (у чистому підпроцесі, без кешу sys.modules)
+IMPORT_MODULES = ["task_1", "task_2", "task_3", "task_4", "task_5", "task_6", "task_7", "compact_tree"]
+HEAVY_MODULES = ("matplotlib", "numpy", "networkx")
+
+_IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str, repeat: int = 5) -> dict:
+    """
+    Найкращий час `import module` із repeat свіжих інтерпретаторів
+    і список важких бібліотек, які цей імпорт підтягнув (має бути порожнім).
+    """
+    code = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    here = Path(__file__).resolve().parent
+    times, heavy = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=here, capture_output=True,
+                             text=True, check=True).stdout
+        probe = json.loads(out.strip().splitlines()[-1])
+        times.append(probe["seconds"])
+        heavy = probe["heavy"]
+    return {"best": min(times), "median": statistics.median(times), "repeat": repeat, "heavy": heavy}
+
+
+def measure(fn: Callable, repeat: int) -> List[float]:
+    """
+    Час repeat викликів fn: спершу один прогрів без заміру (кеші, ліниві імпорти, алокатор),
+    далі кожен виклик із вимкненим GC, щоб збирач сміття не потрапляв у випадкові заміри.
+    """
+    fn()
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def host_fingerprint() -> dict:
+    """Модель процесора і кількість ядер: baseline з іншої машини з тим самим Python не порівнюю."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            models = (line.split(":", 1)[1].strip() for line in f if line.startswith("model name"))
+            cpu = next(models, cpu)
+    except OSError:
+        pass
+    return {"cpu": cpu, "cpu_count": os.cpu_count()}
+
+
+def _key(name: str, param) -> str:
+    label = "x".join(str(p) for p in param) if isinstance(param, tuple) else str(param)
+    return f"{name}[{label}]"
+
+
+def run_benchmarks(name_filter: str | None = None, repeat: int = 5) -> dict:
+    """Запускає всі (або відфільтровані) навантаження. Повертає словник, готовий до JSON."""
+    results = {}
+    for name, (setup, params) in WORKLOADS.items():
+        if name_filter and name_filter not in name:
+            continue
+        for param in params:
+            key = _key(name, param)
+            random.seed(0)
+            try:
+                fn = setup(param)
+            except ImportError as exc:
+                results[key] = {"skipped": f"{type(exc).__name__}: {exc}"}
+                continue
+            times = measure(fn, repeat)
+            results[key] = {"best": min(times), "median": statistics.median(times), "repeat": repeat}
+            print(f"{key:<40} best {min(times) * 1000:>10.2f} ms   median {statistics.median(times) * 1000:>10.2f} ms")
+
+    for module in IMPORT_MODULES:
+        key = f"import.{module}"
+        if name_filter and name_filter not in key:
+            continue
+        res = measure_import(module, repeat)
+        results[key] = res
+        note = f"   heavy: {', '.join(res['heavy'])}" if res["heavy"] else ""
+        print(f"{key:<40} best {res['best'] * 1000:>10.2f} ms{note}")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            **host_fingerprint(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+# поля meta, які мають збігатися, щоб часи взагалі можна було порівнювати
+COMPARABLE_META = ("python", "implementation", "machine", "system", "cpu", "cpu_count")
+
+
+def meta_mismatch(current: dict, baseline: dict) -> List[str]:
+    """Описи розбіжностей COMPARABLE_META між поточним запуском і baseline (порожньо — порівнянні)."""
+    cur, base = current.get("meta", {}), baseline.get("meta", {})
+    return [f"{field}: {base.get(field)} -> {cur.get(field)}"
+            for field in COMPARABLE_META if cur.get(field) != base.get(field)]
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25,
+            min_delta: float = 0.005) -> List[str]:
+    """
+    Порівнює медіанні часи з baseline. Повертає список описів регресій: навантаження
+    повільніше за baseline більш ніж у (1 + tolerance) разів і водночас більш ніж на
+    min_delta секунд — для мілісекундних навантажень відносний шум сам по собі не регресія.
+    Якщо baseline записано в іншому середовищі (meta_mismatch: версія Python, реалізація,
+    ОС, процесор), порівняння пропускається (повертає []) — інакше різниця машин
+    виглядала б як регресія.
+    """
+    if meta_mismatch(current, baseline):
+        return []
+
+    regressions = []
+    base = baseline.get("results", {})
+    for key, res in current.get("results", {}).items():
+        old = base.get(key)
+        if not old or "median" not in old or "median" not in res:
+            continue
+        ratio = res["median"] / old["median"] if old["median"] else float("inf")
+        if ratio > 1 + tolerance and res["median"] - old["median"] > min_delta:
+            regressions.append(f"{key}: {old['median'] * 1000:.2f} ms -> "
+                               f"{res['median'] * 1000:.2f} ms (x{ratio:.2f}, медіана)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Бенчмарк усіх завдань")
+    parser.add_argument("--filter", default=None, help="запускати лише навантаження, що містять рядок")
+    parser.add_argument("--repeat", type=int, default=5, help="кількість повторів (default: 5)")
+    parser.add_argument("--out", type=Path, default=Path("bench_results.json"), help="куди зберегти JSON")
+    parser.add_argument("--baseline", type=Path, default=Path("benchmarks_baseline.json"),
+                        help="файл baseline для порівняння")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="допустиме сповільнення як частка (default: 0.25 = +25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.005,
+                        help="мінімальне абсолютне сповільнення медіани в секундах (default: 0.005)")
+    parser.add_argument("--update-baseline", action="store_true", help="записати результати як новий baseline")
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.filter, args.repeat)
+    args.out.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nРезультати: {args.out}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Baseline оновлено: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"Baseline {args.baseline} не знайдено — порівняння пропущено (див. --update-baseline)")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    mismatch = meta_mismatch(current, baseline)
+    if mismatch:
+        print(f"Baseline записано в іншому середовищі ({'; '.join(mismatch)}) — порівняння пропущено "
+              f"(див. --update-baseline)")
+        return
+    regressions = compare(current, baseline, args.tolerance, args.min_delta)
+    if regressions:
+        print("\nРегресії:")
+        for line in regressions:
+            print("  " + line)
+        sys.exit(1)
+    print("Регресій відносно baseline немає.")
+
+
+if __name__ == "__main__":
+    main()
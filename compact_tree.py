@@ -0,0 +1,288 @@
+# Компактне бінарне дерево на масивах (спільне для Завдань 4 і 5).
+
+# Замість об'єктів Node з __dict__, рядком кольору та uuid-id кожен вузол — це індекс i
+# у паралельних масивах: values[i], left[i], right[i], colors[i].
+# Кольори зберігаються як індекси у невеликій палітрі рядків (однакові кольори не дублюються).
+# Обходи, розкладка координат і малювання працюють прямо на масивах, тож у пам'ять
+# вміщаються мільйони вузлів.
+
+import math
+from array import array
+from collections import deque
+
+NO_CHILD = -1  # «посилання» на відсутню дитину
+
+
+def _pack_values(values):
+    """Цілі значення кладу в array('q') (8 байт на вузол), решту — у звичайний список."""
+    try:
+        return array("q", values)
+    except (TypeError, OverflowError):
+        return list(values)
+
+
+class CompactTree:
+    """
+    Бінарне дерево у вигляді паралельних масивів. Корінь — індекс 0.
+
+    values  — значення вузлів (array('q') для цілих або list)
+    left    — array('q') індексів лівих дітей (NO_CHILD, якщо немає)
+    right   — array('q') індексів правих дітей
+    colors  — array('I') індексів у palette
+    palette — список рядків кольорів
+    """
+
+    __slots__ = ("values", "left", "right", "colors", "palette", "_color_index")
+
+    def __init__(self, values, left, right, colors=None, palette=None, default_color="skyblue"):
+        n = len(values)
+        if len(left) != n or len(right) != n:
+            raise ValueError("Масиви values/left/right мають бути однакової довжини")
+        self.values = values
+        self.left = left
+        self.right = right
+        self.palette = list(palette) if palette else [default_color]
+        self._color_index = {c: i for i, c in enumerate(self.palette)}
+        self.colors = colors if colors is not None else array("I", bytes(4 * n))
+
+    def __len__(self):
+        return len(self.values)
+
+    # кольори
+    def color_id(self, color):
+        """Повертає індекс кольору в палітрі (додає новий колір за потреби)."""
+        idx = self._color_index.get(color)
+        if idx is None:
+            idx = len(self.palette)
+            self.palette.append(color)
+            self._color_index[color] = idx
+        return idx
+
+    def set_color(self, i, color):
+        self.colors[i] = self.color_id(color)
+
+    def color(self, i):
+        return self.palette[self.colors[i]]
+
+    def fill_color(self, color):
+        """Фарбує всі вузли одним кольором."""
+        cid = self.color_id(color)
+        self.colors = array("I", [cid]) * len(self)
+
+    # конвертери
+    @classmethod
+    def from_heap(cls, heap_list, node_colors=None, default_color="skyblue"):
+        """
+        Масив-купа -> дерево без проміжних Node: дітьми i є 2i+1 та 2i+2.
+        node_colors — список/словник кольорів за індексами (як у task_4.heap_list_to_tree).
+        """
+        if not heap_list:
+            raise ValueError("Порожня купа – нічого візуалізувати.")
+        n = len(heap_list)
+        left = array("q", (2 * i + 1 if 2 * i + 1 < n else NO_CHILD for i in range(n)))
+        right = array("q", (2 * i + 2 if 2 * i + 2 < n else NO_CHILD for i in range(n)))
+        tree = cls(_pack_values(heap_list), left, right, default_color=default_color)
+
+        if node_colors is not None:
+            if isinstance(node_colors, dict):
+                for i, color in node_colors.items():
+                    if 0 <= i < n:
+                        tree.set_color(i, color)
+            elif isinstance(node_colors, (list, tuple)):
+                for i, color in enumerate(node_colors[:n]):
+                    tree.set_color(i, color)
+        return tree
+
+    @classmethod
+    def from_node(cls, root, default_color="skyblue"):
+        """
+        Дерево з об'єктів Node (поля left/right/val/color) -> масиви.
+        Індекси роздаються у порядку BFS, тож батько завжди має менший індекс за дітей.
+        """
+        if root is None:
+            raise ValueError("Порожнє дерево – нічого конвертувати.")
+        values, left, right = [], array("q"), array("q")
+        tree = cls([], array("q"), array("q"), colors=array("I"), default_color=default_color)
+        colors = tree.colors
+
+        q = deque([root])
+        nxt = 1  # індекс, який отримає наступна дитина в черзі
+        while q:
+            node = q.popleft()
+            values.append(node.val)
+            colors.append(tree.color_id(getattr(node, "color", default_color)))
+            if node.left:
+                left.append(nxt)
+                nxt += 1
+                q.append(node.left)
+            else:
+                left.append(NO_CHILD)
+            if node.right:
+                right.append(nxt)
+                nxt += 1
+                q.append(node.right)
+            else:
+                right.append(NO_CHILD)
+
+        tree.values = _pack_values(values)
+        tree.left = left
+        tree.right = right
+        return tree
+
+    def to_node(self, node_cls):
+        """Масиви -> дерево з об'єктів node_cls(key, color=...). Повертає корінь."""
+        nodes = [node_cls(self.values[i], color=self.color(i)) for i in range(len(self))]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NO_CHILD:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NO_CHILD:
+                node.right = nodes[self.right[i]]
+        return nodes[0] if nodes else None
+
+    def to_heap(self):
+        """
+        Значення у порядку BFS як масив-купа. Можливо лише для повного дерева
+        (усі рівні заповнені, останній — зліва направо), інакше ValueError.
+        """
+        out = []
+        gap = False  # чи вже траплялась відсутня дитина у BFS-порядку
+        for i in self.bfs():
+            out.append(self.values[i])
+            for child in (self.left[i], self.right[i]):
+                if child == NO_CHILD:
+                    gap = True
+                elif gap:
+                    raise ValueError("Дерево не повне – його не можна подати як купу")
+        return out
+
+    # обходи (віддають індекси вузлів)
+    def bfs(self):
+        if not len(self):
+            return
+        left, right = self.left, self.right
+        q = deque([0])
+        while q:
+            i = q.popleft()
+            yield i
+            if left[i] != NO_CHILD:
+                q.append(left[i])
+            if right[i] != NO_CHILD:
+                q.append(right[i])
+
+    def preorder(self):
+        if not len(self):
+            return
+        left, right = self.left, self.right
+        stack = array("q", [0])
+        while stack:
+            i = stack.pop()
+            yield i
+            if right[i] != NO_CHILD:
+                stack.append(right[i])
+            if left[i] != NO_CHILD:
+                stack.append(left[i])
+
+    def inorder(self):
+        left, right = self.left, self.right
+        stack = array("q")
+        i = 0 if len(self) else NO_CHILD
+        while stack or i != NO_CHILD:
+            while i != NO_CHILD:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield i
+            i = right[i]
+
+    def postorder(self):
+        left, right = self.left, self.right
+        stack = array("q")
+        i = 0 if len(self) else NO_CHILD
+        last = NO_CHILD
+        while stack or i != NO_CHILD:
+            while i != NO_CHILD:
+                stack.append(i)
+                i = left[i]
+            top = stack[-1]
+            if right[top] != NO_CHILD and right[top] != last:
+                i = right[top]
+            else:
+                stack.pop()
+                yield top
+                last = top
+
+    def traverse(self, kind="bfs"):
+        """Обхід за назвою: bfs, dfs/preorder, inorder, postorder (morris_* дають той самий порядок)."""
+        kinds = {
+            "bfs": self.bfs,
+            "dfs": self.preorder,
+            "preorder": self.preorder,
+            "morris_preorder": self.preorder,
+            "inorder": self.inorder,
+            "morris_inorder": self.inorder,
+            "postorder": self.postorder,
+        }
+        if kind not in kinds:
+            raise ValueError(f"Невідомий тип обходу: {kind!r} (очікую один із {sorted(kinds)})")
+        return kinds[kind]()
+
+    # розкладка і малювання
+    def layout(self):
+        """
+        Координати вузлів (xs, ys) як array('d') — та сама схема, що була в add_edges:
+        корінь у (0, 0), діти на рівень нижче зі зсувом ±1/2**layer.
+        """
+        n = len(self)
+        xs = array("d", bytes(8 * n))
+        ys = array("d", bytes(8 * n))
+        if not n:
+            return xs, ys
+        left, right = self.left, self.right
+        stack = [(0, 1)]  # (індекс, layer дітей)
+        while stack:
+            i, layer = stack.pop()
+            dx = math.ldexp(1.0, -layer)  # 1 / 2**layer без переповнення на глибоких деревах
+            y = ys[i] - 1
+            if left[i] != NO_CHILD:
+                c = left[i]
+                xs[c], ys[c] = xs[i] - dx, y
+                stack.append((c, layer + 1))
+            if right[i] != NO_CHILD:
+                c = right[i]
+                xs[c], ys[c] = xs[i] + dx, y
+                stack.append((c, layer + 1))
+        return xs, ys
+
+    def edges(self):
+        """Пари (батько, дитина) для всіх ребер."""
+        for i in range(len(self)):
+            if self.left[i] != NO_CHILD:
+                yield i, self.left[i]
+            if self.right[i] != NO_CHILD:
+                yield i, self.right[i]
+
+    def draw(self, ax, title="", node_size=2500, font_size=12, font_weight="normal",
+             label_limit=500, pos=None):
+        """
+        Малює дерево на осях matplotlib ax: ребра — однією LineCollection, вузли — одним scatter.
+        Підписи ставляться лише якщо вузлів не більше label_limit.
+        pos — готові (xs, ys) з layout(), щоб не рахувати їх для кожного кадру.
+        """
+        from matplotlib.collections import LineCollection
+
+        xs, ys = pos if pos is not None else self.layout()
+        segments = [((xs[p], ys[p]), (xs[c], ys[c])) for p, c in self.edges()]
+        ax.add_collection(LineCollection(segments, colors="k", linewidths=1.0, zorder=1))
+
+        palette = self.palette
+        ax.scatter(xs, ys, s=node_size, c=[palette[c] for c in self.colors], zorder=2)
+
+        if len(self) <= label_limit:
+            for i in range(len(self)):
+                ax.text(xs[i], ys[i], str(self.values[i]), ha="center", va="center",
+                        fontsize=font_size, fontweight=font_weight, zorder=3)
+
+        ax.set_title(title)
+        ax.axis("off")
+        ax.margins(0.08, 0.15)  # щоб великі маркери крайніх вузлів не обрізались
+        ax.autoscale_view()
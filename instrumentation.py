@@ -0,0 +1,97 @@
+# Опційна інструментація розв'язувачів (Дейкстра з task_3, рюкзак з task_6).
+
+# Розв'язувач приймає stats=None (за замовчуванням — нуль роботи) або об'єкт SolverStats,
+# у який складаються лічильники (пуші/попи купи, релаксації, комірки ДП ...) і час фаз.
+# Щоб подивитися на гарячі місця детальніше, у SolverStats можна передати cProfile.Profile:
+# профайлер вмикається лише всередині фаз розв'язувача.
+
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class SolverStats:
+    """
+    Збирач статистики одного чи кількох викликів розв'язувача.
+
+    counters — сумарні лічильники подій, {назва: int}
+    phases   — сумарний час фаз у секундах, {назва: float}
+    labels   — довільні мітки (обраний режим, розмір входу ...)
+    profiler — необов'язковий cProfile.Profile (або будь-що з enable()/disable())
+    """
+
+    enabled = True
+
+    def __init__(self, profiler=None):
+        self.counters = {}
+        self.phases = {}
+        self.labels = {}
+        self.profiler = profiler
+
+    def add(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def label(self, name, value):
+        self.labels[name] = value
+
+    @contextmanager
+    def phase(self, name):
+        """Міряє час блоку with (і вмикає профайлер на цей час, якщо він є)."""
+        if self.profiler is not None:
+            self.profiler.enable()
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - t0
+            if self.profiler is not None:
+                self.profiler.disable()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def as_dict(self):
+        """Структурований знімок для логів/JSON."""
+        return {
+            "counters": dict(self.counters),
+            "phases": dict(self.phases),
+            "total_seconds": sum(self.phases.values()),
+            "labels": dict(self.labels),
+        }
+
+    def reset(self):
+        self.counters.clear()
+        self.phases.clear()
+        self.labels.clear()
+
+    def __repr__(self):
+        return f"SolverStats({self.as_dict()!r})"
+
+
+class _NoStats:
+    """Заглушка за замовчуванням: ті самі методи, жодної роботи."""
+
+    enabled = False
+
+    def add(self, name, value=1):
+        pass
+
+    def label(self, name, value):
+        pass
+
+    def phase(self, name):
+        return nullcontext(self)
+
+
+NO_STATS = _NoStats()
+
+
+def profile_solver(func, *args, **kwargs):
+    """
+    Запускає func(*args, stats=..., **kwargs) під cProfile.
+    Повертає (результат, SolverStats, pstats.Stats) — останнє можна друкувати чи зберігати (dump_stats).
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    stats = SolverStats(profiler=profiler)
+    result = func(*args, stats=stats, **kwargs)
+    return result, stats, pstats.Stats(profiler)
@@ -0,0 +1,236 @@
+# Asyncio-сервіс запитів до Дейкстри (task_3) і рюкзака (task_6).
+
+# Розв'язки виконуються у пулі процесів, у кожному з яких графи й меню завантажені
+# один раз (initializer), тож запит передає лише назву і параметри.
+# — однакові одночасні запити зливаються в один (single-flight);
+# — дрібні запити рюкзака до одного меню збираються в мікропакет і розв'язуються
+#   однією таблицею KnapsackSolver для найбільшого бюджету в пакеті;
+# — InProcessExecutor виконує те саме в поточному процесі (для локальних тестів і демо).
+
+"""
+Приклад:
+
+    service = QueryService(graphs={"city": G}, menus={"lunch": items})
+    async with service:
+        dist, parent = await service.shortest_paths("city", "A")
+        names, calories, cost = await service.knapsack("lunch", 100)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+from task_3 import Graph, dijkstra_heap
+from task_6 import dynamic_programming, get_solver
+
+# Реєстр воркера-процесу: заповнюється один раз при старті процесу.
+# InProcessExecutor має власний реєстр того ж вигляду і передає його задачам через registry=,
+# тож кілька локальних сервісів в одному процесі не перетирають графи й меню одне одного.
+_WORKER = {"graphs": {}, "menus": {}}
+
+
+def _init_worker(graphs, menus, registry=None):
+    registry = _WORKER if registry is None else registry
+    registry["graphs"] = dict(graphs or {})
+    registry["menus"] = dict(menus or {})
+
+
+def _solve_paths(graph_name, start, registry=None):
+    registry = _WORKER if registry is None else registry
+    return dijkstra_heap(registry["graphs"][graph_name], start)
+
+
+def _solve_knapsack_batch(menu_name, budgets, registry=None):
+    """Один розв'язувач на весь пакет: таблиця для max(budgets), відповіді за O(n) кожна."""
+    registry = _WORKER if registry is None else registry
+    solver = get_solver(registry["menus"][menu_name], max(budgets))
+    return [solver.solve(b) for b in budgets]
+
+
+def _solve_knapsack_large(menu_name, budget, registry=None):
+    """Великий бюджет: без таблиці на весь бюджет і без кешу — режим "auto" (gcd/calories/mitm)."""
+    registry = _WORKER if registry is None else registry
+    return dynamic_programming(registry["menus"][menu_name], budget, mode="auto")
+
+
+class InProcessExecutor(Executor):
+    """
+    Замінник пулу процесів: виконує задачі синхронно в поточному процесі.
+    initializer виконується над власним реєстром виконавця (registry=...), і той самий реєстр
+    передається кожній задачі — тож submit приймає лише задачі з параметром registry
+    (функції _solve_* цього модуля). Зручно для тестів і налагодження без fork/spawn.
+    """
+
+    def __init__(self, initializer=None, initargs=()):
+        self._registry = {"graphs": {}, "menus": {}}
+        if initializer is not None:
+            initializer(*initargs, registry=self._registry)
+
+    def submit(self, fn, /, *args, **kwargs):
+        fut = Future()
+        try:
+            fut.set_result(fn(*args, registry=self._registry, **kwargs))
+        except BaseException as exc:  # помилка повертається через Future, як у справжньому пулі
+            fut.set_exception(exc)
+        return fut
+
+
+class QueryService:
+    """
+    Asyncio-фасад над пулом процесів із попередньо завантаженими графами та меню.
+
+    graphs       — {назва: task_3.Graph}
+    menus        — {назва: словник страв у форматі task_6}
+    executor     — готовий Executor; за замовчуванням ProcessPoolExecutor(workers).
+                   Власний executor мусить виконати _init_worker(graphs, menus) у кожному воркері
+                   (initializer/initargs), інакше будь-який розв'язок падає з KeyError.
+    batch_window — скільки секунд чекати на інші запити до того ж меню перед розв'язком пакета
+    max_batch    — пакет відправляється одразу, щойно в ньому стільки різних бюджетів
+    small_budget — запити з бюджетом <= small_budget пакетуються, більші розв'язуються окремо
+                   dynamic_programming(mode="auto") без кешованої таблиці
+    """
+
+    def __init__(self, graphs=None, menus=None, executor=None, workers=None,
+                 batch_window=0.002, max_batch=256, small_budget=100_000):
+        self.graphs = dict(graphs or {})
+        self.menus = dict(menus or {})
+        self._own_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.graphs, self.menus))
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.small_budget = small_budget
+
+        self._inflight = {}  # ключ запиту -> asyncio.Task (single-flight)
+        self._batches = {}   # назва меню -> {бюджет: asyncio.Future}
+        self._timers = {}    # назва меню -> TimerHandle відкладеного відправлення пакета
+
+    @classmethod
+    def local(cls, graphs=None, menus=None, **kwargs):
+        """Сервіс із InProcessExecutor — повний шлях запиту без окремих процесів."""
+        executor = InProcessExecutor(_init_worker, (dict(graphs or {}), dict(menus or {})))
+        return cls(graphs, menus, executor=executor, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        for menu in list(self._batches):
+            self._flush(menu)
+        if self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    # single-flight
+    async def _single_flight(self, key, factory):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # shield: скасування одного з очікувачів не скасовує спільний розв'язок
+        return await asyncio.shield(task)
+
+    def _run(self, fn, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    # Дейкстра
+    async def shortest_paths(self, graph_name, start):
+        """(dist, parent) від start у графі graph_name — як dijkstra_heap."""
+        if graph_name not in self.graphs:
+            raise KeyError(f"Граф {graph_name!r} не завантажено")
+        return await self._single_flight(
+            ("paths", graph_name, start), lambda: self._run(_solve_paths, graph_name, start))
+
+    # рюкзак
+    async def knapsack(self, menu_name, budget):
+        """
+        (список_страв, калорії, вартість) — як dynamic_programming(menu, budget).
+        Для budget > small_budget калорії ті самі, але за рівних оптимумів набір може відрізнятися.
+        """
+        if menu_name not in self.menus:
+            raise KeyError(f"Меню {menu_name!r} не завантажено")
+        if budget < 0:
+            raise ValueError("Бюджет не може бути від'ємним")
+        return await self._single_flight(
+            ("knapsack", menu_name, budget), lambda: self._knapsack(menu_name, budget))
+
+    async def _knapsack(self, menu_name, budget):
+        if budget > self.small_budget:
+            return await self._run(_solve_knapsack_large, menu_name, budget)
+
+        loop = asyncio.get_running_loop()
+        batch = self._batches.setdefault(menu_name, {})
+        fut = batch.get(budget)
+        if fut is None:
+            fut = batch[budget] = loop.create_future()
+        if len(batch) >= self.max_batch:
+            self._flush(menu_name)
+        elif menu_name not in self._timers:
+            self._timers[menu_name] = loop.call_later(self.batch_window, self._flush, menu_name)
+        return await fut
+
+    def _flush(self, menu_name):
+        """Відправляє накопичений пакет меню одним викликом у пул."""
+        timer = self._timers.pop(menu_name, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._batches.pop(menu_name, None)
+        if not batch:
+            return
+        budgets = sorted(batch)
+        solved = self._run(_solve_knapsack_batch, menu_name, budgets)
+
+        def deliver(done):
+            exc = done.exception()
+            results = None if exc else done.result()
+            for k, b in enumerate(budgets):
+                fut = batch[b]
+                if fut.done():
+                    continue
+                if exc:
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(results[k])
+
+        solved.add_done_callback(deliver)
+
+
+# DEMO
+if __name__ == "__main__":
+    import time
+
+    G = Graph(directed=False)
+    G.add_edge('A', 'B', 5)
+    G.add_edge('A', 'C', 10)
+    G.add_edge('B', 'D', 3)
+    G.add_edge('C', 'D', 2)
+    G.add_edge('D', 'E', 4)
+
+    items = {
+        "pizza": {"cost": 50, "calories": 300},
+        "hamburger": {"cost": 40, "calories": 250},
+        "hot-dog": {"cost": 30, "calories": 200},
+        "pepsi": {"cost": 10, "calories": 100},
+        "cola": {"cost": 15, "calories": 220},
+        "potato": {"cost": 25, "calories": 350},
+    }
+
+    async def demo(service, label):
+        t0 = time.perf_counter()
+        async with service:
+            budgets = list(range(0, 201, 5)) * 3  # повтори злиються single-flight'ом
+            answers = await asyncio.gather(*(service.knapsack("lunch", b) for b in budgets))
+            paths = await asyncio.gather(*(service.shortest_paths("city", s) for s in "ABCDEA"))
+        for b, ans in zip(budgets, answers):
+            assert ans == dynamic_programming(items, b)
+        print(f"{label}: {len(budgets)} запитів рюкзака + {len(paths)} Дейкстри "
+              f"за {(time.perf_counter() - t0) * 1000:.1f} мс; бюджет 100 -> {answers[20]}")
+
+    asyncio.run(demo(QueryService.local(graphs={"city": G}, menus={"lunch": items}), "in-process"))
+    asyncio.run(demo(QueryService(graphs={"city": G}, menus={"lunch": items}, workers=2), "процеси"))
@@ -0,0 +1,249 @@
+# Обмін графом і результатами Дейкстри між процесами через multiprocessing.shared_memory.
+
+# Замість того щоб кожен воркер отримував pickle-копію Graph.adj (defaultdict списків кортежів),
+# граф один раз публікується у спільну пам'ять як CSR — три пласкі масиви:
+#   offsets[V+1] (int64) — ребра вершини u лежать у діапазоні offsets[u]..offsets[u+1]
+#   targets[E]   (int64) — кінці ребер (індекси вершин)
+#   weights[E]   (float64) — ваги ребер
+# Воркер підключається до блоку за назвою (без копіювання) і пише dist/parent для свого
+# джерела прямо у заздалегідь виділені спільні масиви розміру [джерела x V].
+# Між процесами передаються лише назви блоків і цілі числа.
+
+import heapq
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+from task_3 import Graph
+
+NO_PARENT = -1
+
+
+def _attach_shm(name):
+    """Підключення до існуючого блоку без реєстрації в resource_tracker (блоком володіє творець)."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # до 3.13 attach теж реєструє блок у (спільному з батьком) трекері — тимчасово вимикаю реєстрацію
+    register = resource_tracker.register
+    resource_tracker.register = lambda n, rtype: None if rtype == "shared_memory" else register(n, rtype)
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class _SharedBlock:
+    """Спільне для графа й результатів: блок пам'яті, memoryview-и поверх нього і прибирання."""
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self._views = []
+
+    def _view(self, offset, count, fmt):
+        view = self.shm.buf[offset:offset + 8 * count].cast(fmt)
+        self._views.append(view)
+        return view
+
+    def close(self):
+        # memoryview-и треба звільнити до close(), інакше BufferError
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedGraph(_SharedBlock):
+    """
+    Граф у CSR-форматі в одному блоці спільної пам'яті.
+    labels (лише у процесу-власника) — мітки вершин за індексами, index — зворотне відображення.
+    """
+
+    def __init__(self, shm, n_vertices, n_edges, owner=False, labels=None):
+        super().__init__(shm, owner)
+        self.n_vertices = n_vertices
+        self.n_edges = n_edges
+        self.labels = labels
+        self.index = {v: i for i, v in enumerate(labels)} if labels is not None else None
+        self.offsets = self._view(0, n_vertices + 1, "q")
+        self.targets = self._view(8 * (n_vertices + 1), n_edges, "q")
+        self.weights = self._view(8 * (n_vertices + 1 + n_edges), n_edges, "d")
+
+    @property
+    def handle(self):
+        """Усе, що потрібно воркеру для attach: (назва блоку, V, E)."""
+        return self.shm.name, self.n_vertices, self.n_edges
+
+    @classmethod
+    def publish(cls, G: Graph):
+        """
+        Копіює граф у новий блок спільної пам'яті (один раз). Вершини нумеруються в порядку
+        сортування міток (якщо мітки порівнювані), тож при рівних відстанях купа обирає
+        вершини в тому ж порядку, що й dijkstra_heap, і parent збігається.
+        """
+        try:
+            labels = sorted(G.adj)
+        except TypeError:
+            labels = list(G.adj)
+        index = {v: i for i, v in enumerate(labels)}
+        n = len(labels)
+        m = sum(len(G.adj[v]) for v in labels)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(8 * (n + 1 + 2 * m), 1))
+        graph = cls(shm, n, m, owner=True, labels=labels)
+        pos = 0
+        for i, u in enumerate(labels):
+            graph.offsets[i] = pos
+            for v, w in G.adj[u]:
+                if w < 0:
+                    graph.close()
+                    raise ValueError("Алгоритм Дейкстри вимагає невід’ємних ваг ребер")
+                graph.targets[pos] = index[v]
+                graph.weights[pos] = w
+                pos += 1
+        graph.offsets[n] = pos
+        return graph
+
+    @classmethod
+    def attach(cls, handle):
+        """Підключення у воркері: нуль копіювання, лише memoryview поверх спільного блоку."""
+        name, n, m = handle
+        return cls(_attach_shm(name), n, m)
+
+
+class SharedResults(_SharedBlock):
+    """Матриці dist (float64) і parent (int64, NO_PARENT = немає) розміру [джерела x V]."""
+
+    def __init__(self, shm, n_sources, n_vertices, owner=False):
+        super().__init__(shm, owner)
+        self.n_sources = n_sources
+        self.n_vertices = n_vertices
+        cells = n_sources * n_vertices
+        self.dist = self._view(0, cells, "d")
+        self.parent = self._view(8 * cells, cells, "q")
+
+    @property
+    def handle(self):
+        return self.shm.name, self.n_sources, self.n_vertices
+
+    @classmethod
+    def create(cls, n_sources, n_vertices):
+        size = max(16 * n_sources * n_vertices, 1)
+        return cls(shared_memory.SharedMemory(create=True, size=size), n_sources, n_vertices, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        name, s, n = handle
+        return cls(_attach_shm(name), s, n)
+
+    def row(self, k):
+        """(dist, parent) для k-го джерела як memoryview-зрізи (без копіювання)."""
+        lo, hi = k * self.n_vertices, (k + 1) * self.n_vertices
+        return self.dist[lo:hi], self.parent[lo:hi]
+
+
+def dijkstra_csr(offsets, targets, weights, source, n_vertices):
+    """
+    Дейкстра з бінарною купою на CSR-масивах (ті самі кроки, що й dijkstra_heap).
+    Повертає (dist, parent) як array('d') і array('q') довжини V.
+    """
+    inf = float("inf")
+    dist = array("d", [inf]) * n_vertices
+    parent = array("q", [NO_PARENT]) * n_vertices
+    dist[source] = 0.0
+    pq = [(0.0, source)]
+
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d != dist[u]:
+            continue  # застарілий запис
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(pq, (nd, v))
+    return dist, parent
+
+
+# Воркер: підключені блоки живуть, поки живе процес
+_WORKER = {}
+
+
+def _init_worker(graph_handle, results_handle):
+    _WORKER["graph"] = SharedGraph.attach(graph_handle)
+    _WORKER["results"] = SharedResults.attach(results_handle)
+
+
+def _solve_row(task):
+    """task = (рядок результатів, індекс джерела). Пише у спільні масиви, повертає лише рядок."""
+    k, source = task
+    g, res = _WORKER["graph"], _WORKER["results"]
+    dist, parent = dijkstra_csr(g.offsets, g.targets, g.weights, source, g.n_vertices)
+    dist_row, parent_row = res.row(k)
+    dist_row[:] = dist
+    parent_row[:] = parent
+    return k
+
+
+def parallel_dijkstra(G: Graph, sources, workers=None, chunksize=1):
+    """
+    Найкоротші шляхи від кожного з sources паралельно в процесах, без pickle графа й результатів.
+    Повертає список пар (dist, parent) у форматі dijkstra_heap — словники за мітками вершин.
+    Як і dijkstra_heap, відсутнє в графі джерело додається як ізольована вершина.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    sources = list(sources)
+    for s in sources:
+        G.adj[s]  # як у dijkstra_heap: невідома вершина стає ізольованою
+
+    with SharedGraph.publish(G) as graph, SharedResults.create(len(sources), graph.n_vertices) as results:
+        tasks = [(k, graph.index[s]) for k, s in enumerate(sources)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph.handle, results.handle)) as pool:
+            for _ in pool.map(_solve_row, tasks, chunksize=chunksize):
+                pass
+
+        labels = graph.labels
+        out = []
+        for k in range(len(sources)):
+            dist_row, parent_row = results.row(k)
+            dist = dict(zip(labels, dist_row))
+            parent = {v: (labels[p] if p != NO_PARENT else None) for v, p in zip(labels, parent_row)}
+            dist_row.release()
+            parent_row.release()
+            out.append((dist, parent))
+    return out
+
+
+# DEMO
+if __name__ == "__main__":
+    import time
+
+    from benchmarks import random_graph
+    from task_3 import dijkstra_heap
+
+    G = random_graph(20_000)
+    sources = list(range(0, 20_000, 1_000))
+
+    t0 = time.perf_counter()
+    expected = [dijkstra_heap(G, s) for s in sources]
+    t_serial = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = parallel_dijkstra(G, sources)
+    t_parallel = time.perf_counter() - t0
+
+    assert got == expected
+    print(f"{len(sources)} джерел, V={len(G.adj)}: послідовно {t_serial:.2f} с, "
+          f"спільна пам'ять {t_parallel:.2f} с")
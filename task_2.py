@@ -4,8 +4,10 @@
 # Програма візуалізує фрактал “дерево Піфагора”, і користувач може вказати рівень рекурсії.
 
 
-import numpy as np
-import matplotlib.pyplot as plt
+import math
+
+# matplotlib імпортується лише в draw_pythagoras_tree: геометрія (pythagoras_squares)
+# підключається без важких бібліотек
 
 def draw_square(ax, pts):
     # Малює квадрат, заданий 4 вершинами (комплексні числа) проти год.стрілки.
@@ -13,9 +15,10 @@ def draw_square(ax, pts):
     ys = [z.imag for z in pts] + [pts[0].imag]
     ax.plot(xs, ys, linewidth=1, color="#8B3A3A")  # колір гілок
 
-def pythagoras(ax, p, v, level, alpha=np.pi/4):
+def pythagoras_squares(p, v, level, alpha=math.pi/4):
     """
-    Рекурсивне малювання дерева Піфагора.
+    Геометрія дерева Піфагора без малювання: віддає квадрати (4 вершини-комплексні числа)
+    у тому ж порядку, у якому їх малює pythagoras. Усього 2**(level+1) - 1 квадратів.
 
     p     — комплексне число: нижня-ліва вершина поточного квадрата.
     v     — комплексний вектор уздовж нижнього ребра (довжина = сторона квадрата).
@@ -29,8 +32,7 @@ def pythagoras(ax, p, v, level, alpha=np.pi/4):
     w = v * 1j
 
     # Поточний квадрат: p -> p+v -> p+v+w -> p+w
-    square = (p, p + v, p + v + w, p + w)
-    draw_square(ax, square)
+    yield (p, p + v, p + v + w, p + w)
 
     if level == 0:
         return
@@ -38,8 +40,8 @@ def pythagoras(ax, p, v, level, alpha=np.pi/4):
     # ТУТ "пересклеюю" посилання (геометрію) до нащадків
     # Обчислюю сторони дочірніх квадратів як вектори:
     # vL і vR — це проєкції по катетах прямокутного трикутника під кутом alpha.
-    vL =  v * np.cos(alpha) - w * np.sin(alpha)    # лівий дочірній квадрат
-    vR =  v * np.sin(alpha) + w * np.cos(alpha)    # правий дочірній квадрат
+    vL =  v * math.cos(alpha) - w * math.sin(alpha)    # лівий дочірній квадрат
+    vR =  v * math.sin(alpha) + w * math.cos(alpha)    # правий дочірній квадрат
 
     # Тепер визначаю їх нові "батьківські" точки (аналог зміни посилань):
     # Лівий квадрат «починається» в верхньо-лівій вершині батька.
@@ -47,17 +49,24 @@ def pythagoras(ax, p, v, level, alpha=np.pi/4):
     # Правий квадрат «починається» у верхньо-правій, але зміщений на власний вектор vR.
     pR = p + v + w - vR
 
-    # Рекурсивно малюю обидва піддерева (щораз менші квадрати й нові «посилання»).
-    pythagoras(ax, pL, vL, level - 1, alpha)
-    pythagoras(ax, pR, vR, level - 1, alpha)
+    # Рекурсивно обходжу обидва піддерева (щораз менші квадрати й нові «посилання»).
+    yield from pythagoras_squares(pL, vL, level - 1, alpha)
+    yield from pythagoras_squares(pR, vR, level - 1, alpha)
+
+def pythagoras(ax, p, v, level, alpha=math.pi/4):
+    """Рекурсивне малювання дерева Піфагора (параметри — як у pythagoras_squares)."""
+    for square in pythagoras_squares(p, v, level, alpha):
+        draw_square(ax, square)
 
 def draw_pythagoras_tree(level=8, angle_deg=45, size=1.0):
     """Точка входу: малює дерево з заданою глибиною й кутом гілок."""
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(8, 8))
     ax.set_aspect("equal")
     ax.axis("off")
 
-    alpha = np.deg2rad(angle_deg)
+    alpha = math.radians(angle_deg)
     base_left = complex(-size/2, 0.0)     # нижня-ліва точка базового квадрата
     base_vec  = complex(size, 0.0)        # вектор уздовж нижнього ребра
 
@@ -31,14 +31,21 @@ class Graph:
         if not self.directed:
             self.adj[v].append((u, w))
 
-def dijkstra_heap(G: Graph, start):
+def dijkstra_heap(G: Graph, start, stats=None):
     """
     Алгоритм Дейкстри з бінарною купою.
     Повертає кортеж (dist, parent), де:
       - dist[v]   — найкоротша відстань від start до v
       - parent[v] — попередник v у найкоротшому шляху (для відновлення маршруту)
     Складність: O((V + E) * log V).
+
+    stats — необов'язковий instrumentation.SolverStats: тоді рахуються пуші/попи купи,
+    пропущені застарілі записи, релаксації, переглянуті ребра, остаточні вершини і час фаз.
+    Без stats працює звичайний цикл без жодних лічильників.
     """
+    if stats is not None:
+        return _dijkstra_heap_instrumented(G, start, stats)
+
     # 1) Ініціалізація: усі відстані — нескінченність, start = 0
     dist = {v: float("inf") for v in G.adj}
     parent = {v: None for v in G.adj}
@@ -82,6 +89,51 @@ def dijkstra_heap(G: Graph, start):
                 heapq.heappush(pq, (nd, v))
     return dist, parent
 
+def _dijkstra_heap_instrumented(G: Graph, start, stats):
+    """Той самий алгоритм, що й dijkstra_heap, але з лічильниками (окремий цикл, щоб не гальмувати основний)."""
+    pushes = pops = stale = relaxations = edges = settled = 0
+
+    with stats.phase("init"):
+        dist = {v: float("inf") for v in G.adj}
+        parent = {v: None for v in G.adj}
+        if start not in dist:
+            dist[start] = 0.0
+            parent[start] = None
+            G.adj[start]
+        dist[start] = 0.0
+        pq = [(0.0, start)]
+        pushes += 1
+
+    with stats.phase("search"):
+        while pq:
+            d, u = heapq.heappop(pq)
+            pops += 1
+            if d != dist[u]:
+                stale += 1
+                continue
+            settled += 1
+
+            for v, w in G.adj[u]:
+                edges += 1
+                if w < 0:
+                    raise ValueError("Алгоритм Дейкстри вимагає невід’ємних ваг ребер")
+                nd = d + w
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    parent[v] = u
+                    relaxations += 1
+                    heapq.heappush(pq, (nd, v))
+                    pushes += 1
+
+    stats.add("vertices", len(G.adj))
+    stats.add("heap_pushes", pushes)
+    stats.add("heap_pops", pops)
+    stats.add("stale_skips", stale)
+    stats.add("relaxations", relaxations)
+    stats.add("edges_scanned", edges)
+    stats.add("settled", settled)
+    return dist, parent
+
 def restore_path(parent, start, target):
     """
     Відновлює шлях start→target за за словником попередників parent.
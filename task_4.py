@@ -10,8 +10,10 @@
 
 import uuid
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
+
+from compact_tree import CompactTree
+
+# matplotlib імпортується лише в draw_tree — побудова купи/дерева не тягне графічних бібліотек
 
 
 # Вузол і допоміжні функції для малювання дерева 
@@ -25,48 +27,16 @@ class Node:
         self.id = str(uuid.uuid4())        # унікальний ідентифікатор вузла
 
 
-def add_edges(graph, node, pos, x=0.0, y=0.0, layer=1):
-    """
-    Рекурсивно додає вузли/ребра у граф NetworkX і рахує координати для візуалізації.
-    """
-    if node is None:
-        return graph
-
-    graph.add_node(node.id, color=node.color, label=node.val)
-
-    # ліва дитина
-    if node.left:
-        graph.add_edge(node.id, node.left.id)
-        lx = x - 1 / (2 ** layer)
-        pos[node.left.id] = (lx, y - 1)
-        add_edges(graph, node.left, pos, x=lx, y=y - 1, layer=layer + 1)
-
-    # права дитина
-    if node.right:
-        graph.add_edge(node.id, node.right.id)
-        rx = x + 1 / (2 ** layer)
-        pos[node.right.id] = (rx, y - 1)
-        add_edges(graph, node.right, pos, x=rx, y=y - 1, layer=layer + 1)
-
-    return graph
-
-
 def draw_tree(tree_root, title="Binary Tree"):
     """
-    Малює дерево з коренем tree_root за допомогою NetworkX + Matplotlib.
+    Малює дерево з коренем tree_root (Node або вже готове CompactTree) за допомогою Matplotlib.
     """
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    add_edges(tree, tree_root, pos)
+    import matplotlib.pyplot as plt
 
-    colors = [data["color"] for _, data in tree.nodes(data=True)]
-    labels = {n: data["label"] for n, data in tree.nodes(data=True)}
+    tree = tree_root if isinstance(tree_root, CompactTree) else CompactTree.from_node(tree_root)
 
     plt.figure(figsize=(9, 6))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False,
-            node_size=2500, node_color=colors, font_size=12)
-    plt.title(title)
-    plt.axis("off")
+    tree.draw(plt.gca(), title=title, node_size=2500, font_size=12)
     plt.tight_layout()
     plt.show()
 
@@ -81,31 +51,8 @@ def heap_list_to_tree(heap_list, node_colors=None):
     :param node_colors: список/словник кольорів вузлів (опційно)
     :return: корінь дерева (Node)
     """
-    if not heap_list:
-        raise ValueError("Порожня купа – нічого візуалізувати.")
-
-    # створення всіх вузлів
-    nodes = []
-    for i, val in enumerate(heap_list):
-        color = "skyblue"
-        if node_colors is not None:
-            if isinstance(node_colors, dict):
-                color = node_colors.get(i, color)
-            elif isinstance(node_colors, (list, tuple)) and i < len(node_colors):
-                color = node_colors[i]
-        nodes.append(Node(val, color=color))
-
-    # з’єднує батьків з дітьми (індекси купи)
-    n = len(nodes)
-    for i in range(n):
-        li = 2 * i + 1
-        ri = 2 * i + 2
-        if li < n:
-            nodes[i].left = nodes[li]
-        if ri < n:
-            nodes[i].right = nodes[ri]
-
-    return nodes[0]  # корінь — елемент з індексом 0
+    # компактне дерево з’єднує індекси купи (i -> 2i+1, 2i+2), далі — об'єкти Node
+    return CompactTree.from_heap(heap_list, node_colors=node_colors).to_node(Node)
 
 
 # Головна функція візуалізації купи
@@ -133,8 +80,9 @@ def draw_heap(iterable, as_max=False, title=None, node_colors=None):
         heapq.heapify(heap_list)
         default_title = "Min-Heap"
 
-    root = heap_list_to_tree(heap_list, node_colors=node_colors)
-    draw_tree(root, title=title or default_title)
+    # малюю прямо з масиву-купи, без проміжних об'єктів Node
+    tree = CompactTree.from_heap(heap_list, node_colors=node_colors)
+    draw_tree(tree, title=title or default_title)
 
 
 #  DEMO 
@@ -150,5 +98,5 @@ if __name__ == "__main__":
 
 
 # heapq.heapify перетворює список на мін-купу на місці.
-# draw_heap збирає масив-купу, далі heap_list_to_tree з’єднує вузли за індексами i -> 2i+1, 2i+2, і врешті draw_tree малює дерево.
+# draw_heap збирає масив-купу, далі CompactTree.from_heap з’єднує вузли за індексами i -> 2i+1, 2i+2, і врешті draw_tree малює дерево.
 # Прапор as_max=True робить макс-купу через інверсію знаків (класичний трюк для heapq).
\ No newline at end of file
@@ -6,8 +6,12 @@
 
 import uuid
 from collections import deque
-import matplotlib.pyplot as plt
-import networkx as nx
+from pathlib import Path
+
+from compact_tree import CompactTree
+
+# matplotlib і concurrent.futures імпортуються всередині функцій малювання/експорту:
+# генератори обходів підключаються без важких бібліотек
 
 
 # Базова модель вузла (як у Завданні 4) 
@@ -20,46 +24,14 @@ class Node:
         self.id = str(uuid.uuid4())  # унікальний id для графа
 
 
-# Побудова графа з дерева й малювання 
-def add_edges(graph, node, pos, x=0.0, y=0.0, layer=1):
-    """Рекурсивне додавання ребер/вузлів для фігури (тільки побудова позицій)."""
-    if node is None:
-        return graph
-    graph.add_node(node.id, color=node.color, label=node.val)
-    if node.left:
-        graph.add_edge(node.id, node.left.id)
-        lx = x - 1 / (2 ** layer)
-        pos[node.left.id] = (lx, y - 1)
-        add_edges(graph, node.left, pos, x=lx, y=y - 1, layer=layer + 1)
-    if node.right:
-        graph.add_edge(node.id, node.right.id)
-        rx = x + 1 / (2 ** layer)
-        pos[node.right.id] = (rx, y - 1)
-        add_edges(graph, node.right, pos, x=rx, y=y - 1, layer=layer + 1)
-    return graph
-
-
+# Малювання (через компактне дерево на масивах)
 def draw_tree(tree_root, title=""):
     """Малює дерево відповідно до поточних кольорів вузлів."""
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    add_edges(tree, tree_root, pos)
+    import matplotlib.pyplot as plt
 
-    colors = [d["color"] for _, d in tree.nodes(data=True)]
-    labels = {n: d["label"] for n, d in tree.nodes(data=True)}
+    tree = CompactTree.from_node(tree_root)
     plt.clf()
-    plt.title(title)
-    nx.draw(
-        tree,
-        pos=pos,
-        labels=labels,
-        arrows=False,
-        node_size=2000,
-        node_color=colors,
-        linewidths=1.5,
-        with_labels=True,
-        font_weight="bold",
-    )
+    tree.draw(plt.gca(), title=title, node_size=2000, font_weight="bold")
     plt.tight_layout()
     plt.draw()
 
@@ -125,52 +97,167 @@ def reset_colors(root, color="#87CEEB"):
             q.append(node.right)
 
 
-#  Візуалізація обходів
-def bfs_visualize(root, animate=True, pause=0.7,
-                  dark="#0B3D91", light="#B3D4FF"):
-    """
-    Обхід у ширину (BFS) чергою. Кожен крок — новий колір від темного до світлого.
-    """
+# Генератори обходів (без малювання, вузли віддаються ліниво)
+def bfs_iter(root):
+    """Обхід у ширину чергою. Пам'ять: O(ширина дерева)."""
     if root is None:
         return
+    q = deque([root])
+    while q:
+        node = q.popleft()
+        yield node
+        if node.left:
+            q.append(node.left)
+        if node.right:
+            q.append(node.right)
 
-    reset_colors(root)
-    total = count_nodes(root)
-    palette = make_gradient(total, dark, light)
 
-    visited = set()
-    order_index = 0
-    q = deque([root])
+def preorder_iter(root):
+    """DFS preorder стеком (корінь -> ліве -> праве). Пам'ять: O(висота)."""
+    if root is None:
+        return
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        # спершу правий, щоб лівий обробився першим
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
 
-    plt.figure(figsize=(9, 5))
-    draw_tree(root, title="BFS: старт")
 
-    while q:
-        node = q.popleft()
-        if node.id in visited:
+def inorder_iter(root):
+    """DFS inorder стеком (ліве -> корінь -> праве). Пам'ять: O(висота)."""
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def postorder_iter(root):
+    """DFS postorder одним стеком (ліве -> праве -> корінь). Пам'ять: O(висота)."""
+    stack = []
+    node = root
+    last = None  # останній відданий вузол — щоб знати, що праве піддерево вже пройдене
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            stack.pop()
+            yield top
+            last = top
+
+
+def _morris_steps(root, preorder):
+    """
+    Ядро обходу Морріса: тимчасово «прошиваю» праві посилання попередників
+    замість стека і відразу ж їх знімаю. Пам'ять: O(1) додаткової.
+    """
+    cur = root
+    while cur:
+        if cur.left is None:
+            yield cur
+            cur = cur.right
             continue
-        visited.add(node.id)
+        # шукаю попередника cur в inorder (найправіший вузол лівого піддерева)
+        pre = cur.left
+        while pre.right and pre.right is not cur:
+            pre = pre.right
+        if pre.right is None:
+            if preorder:
+                yield cur
+            pre.right = cur        # <- тимчасова нитка назад до cur
+            cur = cur.left
+        else:
+            pre.right = None       # <- знімаю нитку, дерево як було
+            if not preorder:
+                yield cur
+            cur = cur.right
+
+
+def _morris_iter(root, preorder):
+    steps = _morris_steps(root, preorder)
+    try:
+        # не yield from: він би закрив і steps, лишивши нитки в дереві
+        for node in steps:
+            yield node
+    finally:
+        # якщо споживач зупинився раніше — доходжу до кінця мовчки, щоб зняти всі нитки
+        for _ in steps:
+            pass
+
+
+def morris_inorder(root):
+    """
+    Inorder-обхід Морріса з O(1) додаткової пам'яті (для дуже глибоких/великих дерев).
+    Під час обходу дерево тимчасово змінюється — не модифікуйте його у циклі.
+    """
+    return _morris_iter(root, preorder=False)
+
+
+def morris_preorder(root):
+    """Preorder-обхід Морріса з O(1) додаткової пам'яті (ті самі застереження, що й для inorder)."""
+    return _morris_iter(root, preorder=True)
+
 
+TRAVERSALS = {
+    "bfs": bfs_iter,
+    "dfs": preorder_iter,          # класичний DFS у візуалізації — preorder
+    "preorder": preorder_iter,
+    "inorder": inorder_iter,
+    "postorder": postorder_iter,
+    "morris_inorder": morris_inorder,
+    "morris_preorder": morris_preorder,
+}
+
+
+#  Візуалізація обходів
+def _visualize(root, order, label, animate, pause, dark, light):
+    """Спільна частина bfs/dfs_visualize: order — вже готовий список вузлів."""
+    import matplotlib.pyplot as plt
+
+    palette = make_gradient(len(order), dark, light)
+    for node in order:
+        node.color = "#87CEEB"
+
+    plt.figure(figsize=(9, 5))
+    draw_tree(root, title=f"{label}: старт")
+
+    for step, node in enumerate(order, start=1):
         # фарбує вузол відповідно до кроку
-        node.color = palette[order_index]
-        order_index += 1
+        node.color = palette[step - 1]
 
         # малює крок
-        draw_tree(root, title=f"BFS: крок {order_index}")
+        draw_tree(root, title=f"{label}: крок {step}")
         if animate:
             plt.pause(pause)
 
-        # додає сусідів у чергу
-        if node.left:
-            q.append(node.left)
-        if node.right:
-            q.append(node.right)
-
     # фінальний кадр
-    draw_tree(root, title="BFS: завершено")
+    draw_tree(root, title=f"{label}: завершено")
     plt.show()
 
 
+def bfs_visualize(root, animate=True, pause=0.7,
+                  dark="#0B3D91", light="#B3D4FF"):
+    """
+    Обхід у ширину (BFS) чергою. Кожен крок — новий колір від темного до світлого.
+    """
+    if root is None:
+        return
+    # один прохід: порядок відвідування дає і кількість вузлів для градієнта
+    _visualize(root, list(bfs_iter(root)), "BFS", animate, pause, dark, light)
+
+
 def dfs_visualize(root, animate=True, pause=0.7,
                   dark="#00441B", light="#C7E9C0"):
     """
@@ -179,46 +266,246 @@ def dfs_visualize(root, animate=True, pause=0.7,
     """
     if root is None:
         return
+    _visualize(root, list(preorder_iter(root)), "DFS", animate, pause, dark, light)
+
+
+# Headless-експорт анімації обходу (без plt.pause/plt.show)
+def traversal_order(root, kind="bfs"):
+    """
+    Повертає список вузлів у порядку відвідування; kind — ключ із TRAVERSALS ("bfs", "dfs", "inorder", ...).
+    """
+    if kind not in TRAVERSALS:
+        raise ValueError(f"Невідомий тип обходу: {kind!r} (очікую один із {sorted(TRAVERSALS)})")
+    return list(TRAVERSALS[kind](root))
+
+
+# палітри за замовчуванням — ті самі, що в bfs_visualize/dfs_visualize
+DEFAULT_PALETTES = {
+    "bfs": ("#0B3D91", "#B3D4FF"),
+    "dfs": ("#00441B", "#C7E9C0"),
+}
 
-    reset_colors(root)
-    total = count_nodes(root)
-    palette = make_gradient(total, dark, light)
 
+def export_traversal(root, path, kind="bfs", fps=2, dpi=100,
+                     dark=None, light=None, base_color="#87CEEB"):
+    """
+    Рендерить обхід у файл без вікна: .gif (PillowWriter), .mp4 (FFMpegWriter)
+    або теку з PNG-кадрами frame_0000.png, frame_0001.png, ... (якщо path без суфікса).
+    Порядок відвідування і палітра make_gradient рахуються один раз наперед.
+    root — корінь Node або вже готове CompactTree (його кольори під час рендеру перезаписуються).
+    Повертає шлях до результату (Path).
+    """
+    # імпорти тут: Agg-канва не потребує дисплея і не чіпає бекенд pyplot
+    from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if root is None:
+        raise ValueError("Порожнє дерево – нічого експортувати.")
+
+    if kind not in TRAVERSALS:
+        raise ValueError(f"Невідомий тип обходу: {kind!r} (очікую один із {sorted(TRAVERSALS)})")
+
+    # масиви, позиції й порядок будую один раз — кадри відрізняються лише кольорами
+    tree = root if isinstance(root, CompactTree) else CompactTree.from_node(root)
+    pos = tree.layout()
+    order = list(tree.traverse(kind))
+    # усі DFS-варіанти (preorder/inorder/...) — зеленою палітрою
+    default_dark, default_light = DEFAULT_PALETTES.get(kind, DEFAULT_PALETTES["dfs"])
+    palette = make_gradient(len(order), dark or default_dark, light or default_light)
+    step_ids = [tree.color_id(c) for c in palette]
+    tree.fill_color(base_color)
+    base_colors = tree.colors
+
+    label = kind.upper()
+    n_frames = len(order) + 2  # старт, кроки 1..n, фінальний кадр
+
+    fig = Figure(figsize=(9, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    def render(frame):
+        visited = min(frame, len(order))
+        colors = base_colors[:]
+        for j in range(visited):
+            colors[order[j]] = step_ids[j]
+        tree.colors = colors
+        if frame == 0:
+            title = f"{label}: старт"
+        elif frame <= len(order):
+            title = f"{label}: крок {frame}"
+        else:
+            title = f"{label}: завершено"
+        ax.clear()
+        tree.draw(ax, title=title, node_size=2000, font_weight="bold", pos=pos)
+        return ()
+
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == "":
+        # нумеровані PNG-кадри
+        path.mkdir(parents=True, exist_ok=True)
+        for frame in range(n_frames):
+            render(frame)
+            fig.savefig(path / f"frame_{frame:04d}.png", dpi=dpi)
+        return path
+
+    if suffix == ".gif":
+        writer = PillowWriter(fps=fps)
+    elif suffix == ".mp4":
+        writer = FFMpegWriter(fps=fps)
+    else:
+        raise ValueError(f"Непідтримуваний формат: {suffix!r} (очікую .gif, .mp4 або теку)")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    anim = FuncAnimation(fig, render, frames=n_frames, blit=False, repeat=False)
+    anim.save(str(path), writer=writer, dpi=dpi)
+    return path
+
+
+def _compact_job(job):
+    """Замінює корінь Node у job на CompactTree: пласкі масиви pickle-яться без рекурсії."""
+    if isinstance(job, dict):
+        root = job["root"]
+        return {**job, "root": root if isinstance(root, CompactTree) else CompactTree.from_node(root)}
+    root, *rest = job
+    return (root if isinstance(root, CompactTree) else CompactTree.from_node(root), *rest)
+
+
+def _export_job(job):
+    """Обгортка для ProcessPoolExecutor: job = (root, path, kind) або словник аргументів."""
+    if isinstance(job, dict):
+        return export_traversal(**job)
+    return export_traversal(*job)
+
+
+def export_traversals(jobs, workers=None):
+    """
+    Паралельно рендерить кілька дерев у робочих процесах.
+    jobs — ітерабельне з кортежів (root, path, kind) або словників аргументів export_traversal.
+    Дерева Node перетворюються на CompactTree ще в батьківському процесі: pickle вузлів
+    рекурсивний і падає з RecursionError на глибоких деревах, а масиви передаються пласко.
+    workers=1 — послідовно в поточному процесі. Повертає список шляхів у порядку jobs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [_compact_job(job) for job in jobs]
+    if workers == 1 or len(jobs) <= 1:
+        return [_export_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_export_job, jobs))
+
+
+# Бенчмарк обходів: час і пікова пам'ять
+def build_tree(n, shape="balanced"):
+    """
+    Будує дерево з n вузлів без рекурсії: "balanced" — повне (за індексами купи),
+    "left_chain" — ланцюжок лівих нащадків (найгірший випадок для стека).
+    """
+    nodes = [Node(i) for i in range(n)]
+    if shape == "balanced":
+        for i in range(n):
+            if 2 * i + 1 < n:
+                nodes[i].left = nodes[2 * i + 1]
+            if 2 * i + 2 < n:
+                nodes[i].right = nodes[2 * i + 2]
+    elif shape == "left_chain":
+        for i in range(n - 1):
+            nodes[i].left = nodes[i + 1]
+    else:
+        raise ValueError(f"Невідома форма дерева: {shape!r}")
+    return nodes[0] if nodes else None
+
+
+def _legacy_bfs(root):
+    """Попередня схема bfs_visualize без малювання: count_nodes + reset_colors + visited-множина id."""
+    reset_colors(root)
+    count_nodes(root)
     visited = set()
-    order_index = 0
-    stack = [root]
+    q = deque([root])
+    while q:
+        node = q.popleft()
+        if node.id in visited:
+            continue
+        visited.add(node.id)
+        yield node
+        if node.left:
+            q.append(node.left)
+        if node.right:
+            q.append(node.right)
 
-    plt.figure(figsize=(9, 5))
-    draw_tree(root, title="DFS: старт")
 
+def _legacy_dfs(root):
+    """Попередня схема dfs_visualize без малювання."""
+    reset_colors(root)
+    count_nodes(root)
+    visited = set()
+    stack = [root]
     while stack:
         node = stack.pop()
         if node.id in visited:
             continue
         visited.add(node.id)
-
-        # фарбує вузол відповідно до кроку
-        node.color = palette[order_index]
-        order_index += 1
-
-        # малює крок
-        draw_tree(root, title=f"DFS: крок {order_index}")
-        if animate:
-            plt.pause(pause)
-
-        # кладе в стек спочатку правого, потім лівого — щоб лівий обробився першим
+        yield node
         if node.right:
             stack.append(node.right)
         if node.left:
             stack.append(node.left)
 
-    # фінальний кадр
-    draw_tree(root, title="DFS: завершено")
-    plt.show()
+
+def benchmark_traversals(sizes=(10_000, 100_000), shapes=("balanced", "left_chain"), repeat=3):
+    """
+    Порівнює час (найкращий із repeat) і пікову додаткову пам'ять (tracemalloc)
+    генераторів обходу з попередніми стек/черга-версіями. Повертає список словників.
+    """
+    import time
+    import tracemalloc
+
+    engines = {"legacy_bfs": _legacy_bfs, "legacy_dfs": _legacy_dfs}
+    engines.update((k, v) for k, v in TRAVERSALS.items() if k != "dfs")
+
+    results = []
+    for shape in shapes:
+        for n in sizes:
+            root = build_tree(n, shape)
+            for name, engine in engines.items():
+                best = float("inf")
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    for _node in engine(root):
+                        pass
+                    best = min(best, time.perf_counter() - t0)
+
+                # пам'ять міряю окремим прогоном, бо tracemalloc сповільнює виконання
+                tracemalloc.start()
+                for _node in engine(root):
+                    pass
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append({"shape": shape, "n": n, "engine": name,
+                                "seconds": best, "peak_bytes": peak})
+    return results
 
 
 # DEMO
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Візуалізація обходів бінарного дерева")
+    parser.add_argument("--export", type=Path, default=None,
+                        help="тека для headless-експорту bfs.gif і dfs.gif замість вікна")
+    parser.add_argument("--workers", type=int, default=None, help="кількість процесів для експорту")
+    parser.add_argument("--bench", action="store_true", help="бенчмарк генераторів обходу замість демо")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"{'Форма':>10} | {'n':>8} | {'Обхід':>16} | {'Час, мс':>9} | {'Пам., КБ':>9}")
+        for r in benchmark_traversals():
+            print(f"{r['shape']:>10} | {r['n']:>8} | {r['engine']:>16} | "
+                  f"{r['seconds'] * 1000:>9.2f} | {r['peak_bytes'] / 1024:>9.1f}")
+        raise SystemExit(0)
+
     # Те саме дерево, що й у Завданні 4:
     root = Node(0)
     root.left = Node(4)
@@ -227,6 +514,16 @@ if __name__ == "__main__":
     root.right = Node(1)
     root.right.left = Node(3)
 
+    if args.export is not None:
+        # CI/рендер-ферма: без дисплея, обидва обходи паралельно
+        paths = export_traversals(
+            [(root, args.export / "bfs.gif", "bfs"), (root, args.export / "dfs.gif", "dfs")],
+            workers=args.workers,
+        )
+        for p in paths:
+            print("Збережено:", p)
+        raise SystemExit(0)
+
     # BFS (черга). Можна поставити animate=False, якщо не потрібна покрокова анімація
     bfs_visualize(root, animate=True, pause=0.6)
 
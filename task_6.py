@@ -4,12 +4,28 @@
 
 — greedy_algorithm: Жадібний алгоритм: бере страви у порядку спадання (калорії/вартість),
   поки не вичерпано бюджет (не гарантує оптимум).
+— greedy_stream: те саме для ітератора страв (напр. read_items_csv) з обмеженою пам'яттю, без повного сортування.
 — dynamic_programming: класичний 0/1 knapsack за калоріями, гарантує оптимум. 
   повертає назви страв, максимальні калорії та їхню загальну вартість при заданому бюджеті.
+  Режими пам'яті: "table" (повна таблиця), "bitset" (рядок + біти рішень), "hirschberg" (O(budget)).
+— KnapsackSolver / get_solver: таблиця будується один раз для найбільшого бюджету,
+  далі будь-який менший бюджет відповідає за O(n); розв'язувачі кешуються за вмістом меню (LRU,
+  обмежений кількістю записів і сумарним розміром таблиць, SOLVER_CACHE_BYTES).
+— Для величезних бюджетів: режими "gcd", "calories", "mitm", "bnb" або "auto" у dynamic_programming.
+— bounded_knapsack / unbounded_knapsack / two_constraint_knapsack: порції "qty", необмежена
+  кількість і друге обмеження (вага чи макронутрієнт) з тим самим форматом результату.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from __future__ import annotations
+
+import bisect
+import importlib.util
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from instrumentation import NO_STATS
 
 
 @dataclass(frozen=True)
@@ -17,14 +33,26 @@ class Item:
     name: str
     cost: int
     calories: int
+    qty: int = 1      # скільки порцій можна взяти (для bounded_knapsack)
+    weight: int = 0   # друге обмеження: вага або макронутрієнт (для two_constraint_knapsack)
 
 
-def normalize_items(items_dict: Dict[str, Dict[str, int]]) -> List[Item]:
-    """З перданого словника формую зручний список Item."""
-    return [Item(name=k, cost=v["cost"], calories=v["calories"])
+def normalize_items(items_dict: Dict[str, Dict[str, int]], weight_key: str = "weight") -> List[Item]:
+    """
+    З перданого словника формую зручний список Item.
+    Необов'язкові поля: "qty" (кількість порцій, за замовчуванням 1) і weight_key (друге обмеження).
+    """
+    return [Item(name=k, cost=v["cost"], calories=v["calories"],
+                 qty=v.get("qty", 1), weight=v.get(weight_key, 0))
             for k, v in items_dict.items()]
 
 
+def _ratio_key(it: Item):
+    """Порядок жадібного вибору: кращий ratio -> більше калорій -> дешевше -> назва (стабільність)."""
+    ratio = it.calories / it.cost if it.cost else float("inf")
+    return ratio, it.calories, -it.cost, it.name
+
+
 def greedy_algorithm(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int, int]:
     """
     Жадібний вибір за найбільшим ratio (calories / cost).
@@ -33,7 +61,7 @@ def greedy_algorithm(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tupl
     items = normalize_items(items_dict)
 
     # Сортую за: кращий ratio -> більше калорій -> дешевше -> назва (стабільність)
-    items.sort(key=lambda it: (it.calories / it.cost, it.calories, -it.cost, it.name), reverse=True)
+    items.sort(key=_ratio_key, reverse=True)
 
     chosen: List[str] = []
     total_cal = 0
@@ -48,46 +76,791 @@ def greedy_algorithm(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tupl
     return chosen, total_cal, total_cost
 
 
-def dynamic_programming(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int, int]:
+# Потокова жадібна вибірка для великих каталогів
+def _as_item(row) -> Item:
+    """Item, кортеж (name, cost, calories) або словник-рядок CSV (значення можуть бути рядками)."""
+    if isinstance(row, Item):
+        return row
+    if isinstance(row, tuple):
+        name, cost, calories = row
+        return Item(name=name, cost=int(cost), calories=int(calories))
+    return Item(name=row["name"], cost=int(row["cost"]), calories=int(row["calories"]))
+
+
+def read_items_csv(path, encoding: str = "utf-8") -> Iterator[Item]:
+    """Ліниво читає каталог CSV зі стовпцями name, cost, calories — по одному Item за раз."""
+    import csv
+
+    with open(path, newline="", encoding=encoding) as f:
+        for row in csv.DictReader(f):
+            yield _as_item(row)
+
+
+def _prune_candidates(pool: List[Item], budget: int) -> List[Item]:
+    """
+    Відкидає страви, які жадібний вибір гарантовано не візьме, і повертає решту в жадібному порядку.
+
+    Якщо X обрано, то на момент X залишок >= cost(X), а отже і кожна краща страва з вартістю
+    <= cost(X) теж влізла й була взята. Тож якщо сума вартостей кращих страв з cost <= cost(X)
+    плюс cost(X) перевищує бюджет — X не буде обрано ніколи, хоч би що ще прийшло з потоку
+    (нові кращі страви лише збільшують цю суму).
+    """
+    pool.sort(key=_ratio_key, reverse=True)  # сортую лише обмежений пул, а не весь каталог
+    ranks = {c: r for r, c in enumerate(sorted({it.cost for it in pool}), start=1)}
+    tree = [0] * (len(ranks) + 1)  # дерево Фенвіка: сума вартостей за рангом вартості
+
+    kept: List[Item] = []
+    for it in pool:
+        r = ranks[it.cost]
+        better = 0
+        j = r
+        while j:
+            better += tree[j]
+            j -= j & -j
+        if better + it.cost <= budget:
+            kept.append(it)
+        j = r
+        while j < len(tree):
+            tree[j] += it.cost
+            j += j & -j
+    return kept
+
+
+def greedy_stream(items: Iterable, budget: int, compact_at: int = 4096) -> Tuple[List[str], int, int]:
+    """
+    Потоковий варіант greedy_algorithm: items — будь-який ітератор (Item, кортежі
+    (name, cost, calories) або рядки з read_items_csv). Каталог не матеріалізується і не
+    сортується повністю: страви дорожчі за бюджет відкидаються одразу, а пул кандидатів
+    періодично проріджується _prune_candidates. Розмір пулу обмежений бюджетом
+    (не більше ~budget * ln(budget) для цілих вартостей), а не розміром каталогу.
+    Результат ідентичний greedy_algorithm на тих самих стравах.
+    """
+    pool: List[Item] = []
+    threshold = compact_at
+    # знімок пулу після останнього проріджування: якщо страва гірша за всі страви знімка,
+    # то всі вони кращі за неї, і правило _prune_candidates перевіряється бінарним пошуком
+    floor_key = None
+    snap_costs: List[int] = []
+    snap_prefix: List[int] = [0]
+
+    for row in items:
+        it = _as_item(row)
+        if it.cost > budget:
+            continue  # не влізе ніколи
+        if floor_key is not None and _ratio_key(it) < floor_key:
+            k = bisect.bisect_right(snap_costs, it.cost)
+            if snap_prefix[k] + it.cost > budget:
+                continue  # гарантовано не буде обрана
+        pool.append(it)
+        if len(pool) >= threshold:
+            pool = _prune_candidates(pool, budget)
+            threshold = max(compact_at, 2 * len(pool))  # амортизовано O(1) на страву
+            if pool:
+                floor_key = _ratio_key(pool[-1])
+                snap_costs = sorted(it.cost for it in pool)
+                snap_prefix = [0]
+                for c in snap_costs:
+                    snap_prefix.append(snap_prefix[-1] + c)
+
+    pool = _prune_candidates(pool, budget)
+
+    # решта — у жадібному порядку; зупиняюсь, щойно залишок менший за найдешевшу страву
+    min_cost_after = [0] * (len(pool) + 1)
+    min_cost_after[-1] = budget + 1
+    for k in range(len(pool) - 1, -1, -1):
+        min_cost_after[k] = min(pool[k].cost, min_cost_after[k + 1])
+
+    chosen: List[str] = []
+    total_cal = 0
+    total_cost = 0
+    for k, it in enumerate(pool):
+        if budget - total_cost < min_cost_after[k]:
+            break
+        if total_cost + it.cost <= budget:
+            chosen.append(it.name)
+            total_cost += it.cost
+            total_cal += it.calories
+
+    return chosen, total_cal, total_cost
+
+
+def _dp_table(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    """
+    Класична повна таблиця (n+1) x (budget+1).
+    Повертає (індекси_обраних, максимум_калорій). Пам'ять: O(n * budget) комірок.
+    """
+    n = len(items)
+
+    with stats.phase("fill"):
+        # dp[i][w] = максимум калорій з перших i предметів при бюджеті w
+        dp = [[0] * (budget + 1) for _ in range(n + 1)]
+
+        for i in range(1, n + 1):
+            cost_i = items[i - 1].cost
+            cal_i = items[i - 1].calories
+            for w in range(budget + 1):
+                # не беру i-й
+                dp[i][w] = dp[i - 1][w]
+                # беру i-й (якщо влізає)
+                if cost_i <= w:
+                    cand = dp[i - 1][w - cost_i] + cal_i
+                    if cand > dp[i][w]:
+                        dp[i][w] = cand
+    stats.add("dp_cells", n * (budget + 1))
+
+    with stats.phase("backtrack"):
+        # Відновлюю вибір (backtracking з dp)
+        chosen: List[int] = []
+        w = budget
+        for i in range(n, 0, -1):
+            if dp[i][w] != dp[i - 1][w]:  # предмет i-1 використаний
+                chosen.append(i - 1)
+                w -= items[i - 1].cost
+
+        chosen.reverse()
+    return chosen, dp[n][budget]
+
+
+def _row_cells(items: List[Item], budget: int) -> int:
+    """Скільки комірок оновлює ковзний рядок: для кожного предмета w = cost..budget."""
+    return sum(budget - it.cost + 1 for it in items if it.cost <= budget)
+
+
+def _fill_bitset(items: List[Item], budget: int) -> Tuple[List[int], bytearray, int]:
+    """
+    Один «ковзний» рядок dp (оновлюю справа наліво, щоб кожен предмет брався не більше разу)
+    + компактна бітова матриця рішень take[i][w] = 1, якщо dp[i][w] > dp[i-1][w].
+    Повертає (рядок, біти, байтів_на_рядок). Пам'ять: O(budget) чисел + n * budget / 8 байт.
+    """
+    row = [0] * (budget + 1)
+    row_bytes = (budget >> 3) + 1
+    take = bytearray(len(items) * row_bytes)
+
+    for i, it in enumerate(items):
+        cost_i, cal_i = it.cost, it.calories
+        base = i * row_bytes
+        for w in range(budget, cost_i - 1, -1):
+            cand = row[w - cost_i] + cal_i
+            if cand > row[w]:
+                row[w] = cand
+                take[base + (w >> 3)] |= 1 << (w & 7)
+    return row, take, row_bytes
+
+
+def _backtrack_bits(items: List[Item], take: bytearray, row_bytes: int, budget: int) -> List[int]:
+    """Відновлення вибору з бітової матриці (та сама логіка, що й для повної таблиці)."""
+    chosen: List[int] = []
+    w = budget
+    for i in range(len(items) - 1, -1, -1):
+        if take[i * row_bytes + (w >> 3)] >> (w & 7) & 1:
+            chosen.append(i)
+            w -= items[i].cost
+    chosen.reverse()
+    return chosen
+
+
+def _dp_bitset(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    with stats.phase("fill"):
+        row, take, row_bytes = _fill_bitset(items, budget)
+    if stats.enabled:
+        stats.add("dp_cells", _row_cells(items, budget))
+    with stats.phase("backtrack"):
+        chosen = _backtrack_bits(items, take, row_bytes, budget)
+    return chosen, row[budget]
+
+
+def _best_row(items: List[Item], budget: int, stats=NO_STATS) -> List[int]:
+    """Лише останній рядок dp (без рішень): row[w] — максимум калорій при бюджеті w."""
+    if stats.enabled:
+        stats.add("dp_cells", _row_cells(items, budget))
+    row = [0] * (budget + 1)
+    for it in items:
+        cost_i, cal_i = it.cost, it.calories
+        for w in range(budget, cost_i - 1, -1):
+            cand = row[w - cost_i] + cal_i
+            if cand > row[w]:
+                row[w] = cand
+    return row
+
+
+def _hirschberg(items: List[Item], idx: List[int], budget: int, out: List[int], stats=NO_STATS) -> None:
+    """
+    Розділяй і володарюй: ділю предмети навпіл, рахую рядки для обох половин
+    і шукаю розподіл бюджету b + (budget - b) з максимальною сумою калорій.
+    """
+    if not idx:
+        return
+    if len(idx) == 1:
+        it = items[idx[0]]
+        if it.cost <= budget and it.calories > 0:
+            out.append(idx[0])
+        return
+
+    mid = len(idx) // 2
+    left_row = _best_row([items[i] for i in idx[:mid]], budget, stats)
+    right_row = _best_row([items[i] for i in idx[mid:]], budget, stats)
+    split = max(range(budget + 1), key=lambda b: left_row[b] + right_row[budget - b])
+
+    _hirschberg(items, idx[:mid], split, out, stats)
+    _hirschberg(items, idx[mid:], budget - split, out, stats)
+
+
+def _dp_hirschberg(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    chosen: List[int] = []
+    with stats.phase("divide_and_conquer"):
+        _hirschberg(items, list(range(len(items))), budget, chosen, stats)
+    chosen.sort()
+    return chosen, sum(items[i].calories for i in chosen)
+
+
+def _fill_numpy(items: List[Item], budget: int):
+    """
+    Векторизований аналог _fill_bitset: для кожного предмета одна операція над масивом
+    row[c:] = max(row[c:], row[:-c] + calories) замість циклу по w.
+    Біти рішень пакуються в тому ж форматі, тож відновлення спільне.
+    """
+    import numpy as np  # опційна залежність — потрібна лише цьому рушію
+
+    row = np.zeros(budget + 1, dtype=np.int64)
+    row_bytes = (budget >> 3) + 1
+    take = np.zeros((len(items), row_bytes), dtype=np.uint8)
+    better = np.zeros(budget + 1, dtype=bool)
+
+    for i, it in enumerate(items):
+        cost_i = it.cost
+        if cost_i > budget:
+            continue
+        cand = row[:budget + 1 - cost_i] + it.calories  # новий масив: зсунута копія старого рядка
+        better[:cost_i] = False
+        np.greater(cand, row[cost_i:], out=better[cost_i:])
+        np.maximum(row[cost_i:], cand, out=row[cost_i:])
+        take[i] = np.packbits(better, bitorder="little")
+
+    return row, take.reshape(-1), row_bytes
+
+
+def _dp_numpy(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    with stats.phase("fill"):
+        row, take, row_bytes = _fill_numpy(items, budget)
+    if stats.enabled:
+        stats.add("dp_cells", _row_cells(items, budget))
+    with stats.phase("backtrack"):
+        chosen = _backtrack_bits(items, take, row_bytes, budget)
+    return chosen, int(row[budget])
+
+
+def _numpy_available() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+# Рушії, що не залежать (або майже не залежать) від розміру бюджету
+def _dp_gcd(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    """
+    Масштабування вартостей: якщо всі вартості кратні g, то dp залежить лише від budget // g,
+    тож таблиця стискається у g разів. Набір ідентичний "table".
+    """
+    with stats.phase("scale"):
+        g = 0
+        for it in items:
+            g = math.gcd(g, it.cost)
+        g = g or 1  # усі вартості нульові — масштабувати нічого
+        scaled = [replace(it, cost=it.cost // g) for it in items]
+    stats.label("gcd", g)
+    engine = _dp_numpy if _numpy_available() else _dp_bitset
+    return engine(scaled, budget // g, stats)
+
+
+def _dp_calories(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    """
+    Двоїсте ДП за калоріями: mincost[v] — мінімальна вартість набору рівно з v калоріями.
+    Відповідь — найбільше v з mincost[v] <= budget. Складність O(n * сума_калорій), бюджет не важливий.
+    """
+    total = sum(it.calories for it in items)
+    with stats.phase("fill"):
+        inf = budget + 1  # усе, що дорожче за бюджет, однаково недосяжне
+        mincost = [inf] * (total + 1)
+        mincost[0] = 0
+        row_bytes = (total >> 3) + 1
+        take = bytearray(len(items) * row_bytes)
+        cells = 0
+
+        for i, it in enumerate(items):
+            cal_i, cost_i = it.calories, it.cost
+            if cal_i == 0 or cost_i > budget:
+                continue
+            cells += total - cal_i + 1
+            base = i * row_bytes
+            for v in range(total, cal_i - 1, -1):
+                cand = mincost[v - cal_i] + cost_i
+                if cand < mincost[v]:
+                    mincost[v] = cand
+                    take[base + (v >> 3)] |= 1 << (v & 7)
+    stats.add("dp_cells", cells)
+
+    with stats.phase("backtrack"):
+        best = max(v for v in range(total + 1) if mincost[v] <= budget)
+        chosen: List[int] = []
+        v = best
+        for i in range(len(items) - 1, -1, -1):
+            if take[i * row_bytes + (v >> 3)] >> (v & 7) & 1:
+                chosen.append(i)
+                v -= items[i].calories
+        chosen.reverse()
+    return chosen, best
+
+
+MITM_MAX_ITEMS = 40
+
+
+def _half_subsets(items: List[Item], idx: List[int], budget: int):
+    """Усі підмножини idx з вартістю <= budget: паралельні списки (вартості, калорії, маски)."""
+    costs, cals, masks = [0], [0], [0]
+    for bit, i in enumerate(idx):
+        cost_i, cal_i = items[i].cost, items[i].calories
+        flag = 1 << bit
+        for k in range(len(costs)):
+            c = costs[k] + cost_i
+            if c <= budget:
+                costs.append(c)
+                cals.append(cals[k] + cal_i)
+                masks.append(masks[k] | flag)
+    return costs, cals, masks
+
+
+def _dp_mitm(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    """
+    Meet-in-the-middle для n <= 40: перебираю 2^(n/2) підмножин кожної половини,
+    другу зводжу до Парето-фронту (дорожче => калорійніше) і для кожної підмножини першої
+    бінарним пошуком беру найкращу пару. Час O(2^(n/2) * n), бюджет не важливий.
+    """
+    n = len(items)
+    if n > MITM_MAX_ITEMS:
+        raise ValueError(f"meet-in-the-middle розрахований на n <= {MITM_MAX_ITEMS}, отримано {n}")
+    left_idx = list(range(n // 2))
+    right_idx = list(range(n // 2, n))
+    with stats.phase("enumerate"):
+        l_costs, l_cals, l_masks = _half_subsets(items, left_idx, budget)
+        r_costs, r_cals, r_masks = _half_subsets(items, right_idx, budget)
+
+        # Парето-фронт правої половини: за зростанням вартості калорії строго зростають
+        front_cost, front_cal, front_mask = [], [], []
+        for k in sorted(range(len(r_costs)), key=lambda k: (r_costs[k], -r_cals[k])):
+            if not front_cal or r_cals[k] > front_cal[-1]:
+                front_cost.append(r_costs[k])
+                front_cal.append(r_cals[k])
+                front_mask.append(r_masks[k])
+    stats.add("subsets", len(l_costs) + len(r_costs))
+    stats.add("pareto_front", len(front_cost))
+
+    with stats.phase("match"):
+        best_cal, best_l, best_r = -1, 0, 0
+        for k in range(len(l_costs)):
+            j = bisect.bisect_right(front_cost, budget - l_costs[k]) - 1  # j >= 0: порожня підмножина
+            total = l_cals[k] + front_cal[j]
+            if total > best_cal:
+                best_cal, best_l, best_r = total, l_masks[k], front_mask[j]
+
+    chosen = [left_idx[b] for b in range(len(left_idx)) if best_l >> b & 1]
+    chosen += [right_idx[b] for b in range(len(right_idx)) if best_r >> b & 1]
+    return chosen, best_cal
+
+
+def _dp_bnb(items: List[Item], budget: int, stats=NO_STATS) -> Tuple[List[int], int]:
+    """
+    Гілки та межі: предмети в порядку greedy_algorithm (за ratio), верхня межа — дробовий
+    рюкзак, нижня на старті — результат жадібного вибору. Бюджет на складність не впливає,
+    але в гіршому випадку перебір експоненційний.
+    """
+    order = sorted((i for i, it in enumerate(items) if it.cost <= budget),
+                   key=lambda i: _ratio_key(items[i]), reverse=True)
+    costs = [items[i].cost for i in order]
+    cals = [items[i].calories for i in order]
+    n = len(order)
+
+    def upper_bound(k: int, cap: int, value: int) -> float:
+        # жадібно докладаю цілі предмети, останній — частково
+        for j in range(k, n):
+            if costs[j] <= cap:
+                cap -= costs[j]
+                value += cals[j]
+            else:
+                return value + cals[j] * cap / costs[j]
+        return value
+
+    # стартова нижня межа — жадібний вибір у тому ж порядку
+    best_cal, best_set, cap = 0, [], budget
+    for j in range(n):
+        if costs[j] <= cap:
+            cap -= costs[j]
+            best_cal += cals[j]
+            best_set.append(j)
+
+    # явний стек замість рекурсії (глибина дорівнює n і перевищила б ліміт рекурсії Python);
+    # вибрані предмети — незмінний зв'язний список (j, попередній), спільний для гілок
+    nodes = 0
+    with stats.phase("search"):
+        stack = [(0, budget, 0, None)]
+        while stack:
+            k, cap, value, taken = stack.pop()
+            nodes += 1
+            if value > best_cal:
+                best_cal, best_set, link = value, [], taken
+                while link is not None:
+                    j, link = link
+                    best_set.append(j)
+            if k == n or upper_bound(k, cap, value) <= best_cal:
+                continue
+            stack.append((k + 1, cap, value, taken))  # «не беру» — обробиться пізніше
+            if costs[k] <= cap:                        # спершу гілка «беру»
+                stack.append((k + 1, cap - costs[k], value + cals[k], (k, taken)))
+    stats.add("bnb_nodes", nodes)
+    return sorted(order[j] for j in best_set), best_cal
+
+
+def choose_mode(items: List[Item], budget: int) -> str:
+    """
+    Обирає точний рушій з найменшою оцінкою роботи:
+    n * (budget / gcd) для "gcd", n * сума_калорій для "calories", 2^(n/2) * n для "mitm".
+    """
+    n = len(items)
+    g = 0
+    for it in items:
+        g = math.gcd(g, it.cost)
+    estimates = {
+        "gcd": n * (budget // (g or 1) + 1),
+        "calories": n * (sum(it.calories for it in items) + 1),
+    }
+    if n <= MITM_MAX_ITEMS:
+        estimates["mitm"] = (1 << ((n + 1) // 2)) * max(n, 1)
+    return min(estimates, key=estimates.get)
+
+
+# Режими ДП: однаковий оптимум калорій, різна пам'ять
+DP_MODES = {
+    "table": _dp_table,            # O(n * budget) комірок-int
+    "bitset": _dp_bitset,          # O(budget) + n * budget / 8 байт, той самий набір, що й "table"
+    "hirschberg": _dp_hirschberg,  # O(budget) пам'яті, O(n * budget * log n) часу
+    "numpy": _dp_numpy,            # як "bitset", але рядок рахує NumPy (потрібен numpy)
+    "gcd": _dp_gcd,                # бюджет і вартості діляться на НСД вартостей, набір як у "table"
+    "calories": _dp_calories,      # двоїсте ДП: O(n * сума_калорій)
+    "mitm": _dp_mitm,              # meet-in-the-middle, n <= 40
+    "bnb": _dp_bnb,                # гілки та межі з жадібною межею
+}
+
+
+def dynamic_programming(items_dict: Dict[str, Dict[str, int]], budget: int,
+                        mode: str = "table", stats=None) -> Tuple[List[str], int, int]:
     """
     ДП (0/1 knapsack) для максимізації калорій при обмеженні бюджету.
     Повертає (список_страв, сумарні_калорії, сумарна_вартість).
-    Складність: O(n * budget) за часом та пам'яттю.
+
+    mode="table"      — повна таблиця, O(n * budget) за часом та пам'яттю;
+    mode="bitset"     — один рядок + біт рішення на комірку (у ~64 рази менше пам'яті),
+                        результат ідентичний "table";
+    mode="hirschberg" — лише O(budget) пам'яті; калорії ті самі, але за кількох
+                        рівноцінних оптимумів може обрати інший набір страв;
+    mode="numpy"      — векторизовані рядки (як "bitset"), результат ідентичний "table".
+
+    Для величезних бюджетів (вартості в копійках, budget ~ 10^8):
+    mode="gcd"        — стискає бюджет у НСД вартостей разів, набір ідентичний "table";
+    mode="calories"   — ДП за сумою калорій, не залежить від бюджету;
+    mode="mitm"       — meet-in-the-middle для n <= 40;
+    mode="bnb"        — гілки та межі (жадібний порядок як межа);
+    mode="auto"       — choose_mode обирає найдешевший із "gcd"/"calories"/"mitm".
+    Останні чотири гарантують той самий оптимум калорій, але за рівних оптимумів набір може відрізнятися.
+
+    stats — необов'язковий instrumentation.SolverStats: кількість заповнених комірок ДП (dp_cells),
+    час фаз (normalize, fill, backtrack, ...) і обраний режим. Без stats лічильники не ведуться.
+    """
+    if mode != "auto" and mode not in DP_MODES:
+        raise ValueError(f"Невідомий режим ДП: {mode!r} (очікую 'auto' або один із {sorted(DP_MODES)})")
+    if stats is None:
+        stats = NO_STATS
+    with stats.phase("normalize"):
+        items = normalize_items(items_dict)
+        if mode == "auto":
+            mode = choose_mode(items, budget)
+    stats.label("mode", mode)
+    stats.label("items", len(items))
+    stats.label("budget", budget)
+
+    chosen_idx, total_cal = DP_MODES[mode](items, budget, stats)
+
+    chosen = [items[i].name for i in chosen_idx]
+    total_cost = sum(items[i].cost for i in chosen_idx)
+    return chosen, total_cal, total_cost
+
+
+# Варіанти задачі: порції, необмежена кількість, два обмеження
+def bounded_knapsack(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int, int]:
+    """
+    Обмежений рюкзак: страву можна взяти до qty разів (поле "qty", за замовчуванням 1).
+    Бінарне розбиття: qty порцій -> пакети 1, 2, 4, ..., залишок, далі звичайний 0/1 по пакетах.
+    Складність O(budget * сума(log qty)) замість O(budget * сума(qty)).
+    Повертає (список_страв, сумарні_калорії, сумарна_вартість); назва повторюється за кожну порцію.
     """
     items = normalize_items(items_dict)
-    n = len(items)
 
-    # dp[i][w] = максимум калорій з перших i предметів при бюджеті w
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
-
-    for i in range(1, n + 1):
-        cost_i = items[i - 1].cost
-        cal_i = items[i - 1].calories
-        for w in range(budget + 1):
-            # не беру i-й
-            dp[i][w] = dp[i - 1][w]
-            # беру i-й (якщо влізає)
-            if cost_i <= w:
-                cand = dp[i - 1][w - cost_i] + cal_i
-                if cand > dp[i][w]:
-                    dp[i][w] = cand
-
-    # Відновлюю вибір (backtracking з dp)
-    chosen: List[str] = []
-    w = budget
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i - 1][w]:  # предмет i-1 використаний
-            chosen.append(items[i - 1].name)
-            w -= items[i - 1].cost
+    packs: List[Item] = []
+    owner: List[Tuple[int, int]] = []  # (індекс страви, кількість порцій у пакеті)
+    for i, it in enumerate(items):
+        left, size = it.qty, 1
+        while left > 0:
+            m = min(size, left)
+            packs.append(Item(name=it.name, cost=it.cost * m, calories=it.calories * m))
+            owner.append((i, m))
+            left -= m
+            size *= 2
 
-    chosen.reverse()
-    total_cal = dp[n][budget]
-    total_cost = sum(items_dict[name]["cost"] for name in chosen)
+    engine = _dp_numpy if _numpy_available() else _dp_bitset
+    chosen_packs, total_cal = engine(packs, budget)
+
+    portions = [0] * len(items)
+    for p in chosen_packs:
+        i, m = owner[p]
+        portions[i] += m
+    chosen = [it.name for it, k in zip(items, portions) for _ in range(k)]
+    total_cost = sum(it.cost * k for it, k in zip(items, portions))
     return chosen, total_cal, total_cost
 
 
+def unbounded_knapsack(items_dict: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int, int]:
+    """
+    Необмежений рюкзак: кожну страву можна брати скільки завгодно разів.
+    Один рядок, прохід зліва направо (тому предмет може «повторно» увійти). O(n * budget).
+    """
+    items = normalize_items(items_dict)
+    for it in items:
+        if it.cost <= 0 and it.calories > 0:
+            raise ValueError(f"Страва {it.name!r} безкоштовна — необмежений вибір не має оптимуму")
+
+    row = [0] * (budget + 1)
+    choice = [-1] * (budget + 1)  # який предмет дав останнє покращення row[w]
+    for i, it in enumerate(items):
+        cost_i, cal_i = it.cost, it.calories
+        if cost_i <= 0:
+            continue
+        for w in range(cost_i, budget + 1):
+            cand = row[w - cost_i] + cal_i
+            if cand > row[w]:
+                row[w] = cand
+                choice[w] = i
+
+    # row[w] = row[w - cost] + calories для обраного предмета, тож іду назад за choice
+    counts = [0] * len(items)
+    w = budget
+    while choice[w] != -1:
+        i = choice[w]
+        counts[i] += 1
+        w -= items[i].cost
+
+    chosen = [it.name for it, k in zip(items, counts) for _ in range(k)]
+    total_cost = sum(it.cost * k for it, k in zip(items, counts))
+    return chosen, row[budget], total_cost
+
+
+def two_constraint_knapsack(items_dict: Dict[str, Dict[str, int]], budget: int, limit: int,
+                            key: str = "weight") -> Tuple[List[str], int, int]:
+    """
+    0/1 рюкзак з двома обмеженнями: сумарна вартість <= budget і сума поля key <= limit
+    (вага, білки тощо). Ковзна площина (budget+1) x (limit+1) + біти рішень, O(n * budget * limit).
+    """
+    items = normalize_items(items_dict, weight_key=key)
+    width = limit + 1
+    plane = [0] * ((budget + 1) * width)  # plane[b * width + l]
+    plane_bytes = (len(plane) >> 3) + 1
+    take = bytearray(len(items) * plane_bytes)
+
+    for i, it in enumerate(items):
+        cost_i, wt_i, cal_i = it.cost, it.weight, it.calories
+        if cost_i > budget or wt_i > limit:
+            continue
+        base = i * plane_bytes
+        shift = cost_i * width + wt_i
+        for b in range(budget, cost_i - 1, -1):
+            row = b * width
+            for cell in range(row + limit, row + wt_i - 1, -1):
+                cand = plane[cell - shift] + cal_i
+                if cand > plane[cell]:
+                    plane[cell] = cand
+                    take[base + (cell >> 3)] |= 1 << (cell & 7)
+
+    chosen_idx: List[int] = []
+    cell = budget * width + limit
+    for i in range(len(items) - 1, -1, -1):
+        if take[i * plane_bytes + (cell >> 3)] >> (cell & 7) & 1:
+            chosen_idx.append(i)
+            cell -= items[i].cost * width + items[i].weight
+    chosen_idx.reverse()
+
+    chosen = [items[i].name for i in chosen_idx]
+    return chosen, plane[budget * width + limit], sum(items[i].cost for i in chosen_idx)
+
+
+# Багато бюджетів з однієї таблиці
+class KnapsackSolver:
+    """
+    Попередньо обчислений розв'язувач для одного меню: таблиця рішень будується один раз
+    для max_budget, а потім будь-який бюджет <= max_budget відповідає за O(n)
+    (відновлення з бітів take, без перерахунку dp).
+    Результати ідентичні dynamic_programming(items_dict, budget).
+    """
+
+    def __init__(self, items_dict: Dict[str, Dict[str, int]], max_budget: int, engine: str = "auto"):
+        if max_budget < 0:
+            raise ValueError("Бюджет не може бути від'ємним")
+        if engine == "auto":
+            engine = "numpy" if _numpy_available() else "python"
+        if engine not in ("python", "numpy"):
+            raise ValueError(f"Невідомий рушій: {engine!r} (очікую 'auto', 'python' або 'numpy')")
+
+        self.items = normalize_items(items_dict)
+        self.max_budget = max_budget
+        self.engine = engine
+        fill = _fill_numpy if engine == "numpy" else _fill_bitset
+        # row[w] — максимум калорій при бюджеті w; take — біти рішень для всіх w одразу
+        self._row, self._take, self._row_bytes = fill(self.items, max_budget)
+
+    @staticmethod
+    def estimate_nbytes(n_items: int, max_budget: int, engine: str = "auto") -> int:
+        """
+        Оцінка пам'яті таблиці до її побудови: рядок + біти take.
+        Рядок "numpy" — int64 (8 байт на комірку); рядок "python" — список int, тобто
+        8 байт посилання + 32 байти на об'єкт int (28 байт, округлені pymalloc).
+        """
+        if engine == "auto":
+            engine = "numpy" if _numpy_available() else "python"
+        cell = 8 if engine == "numpy" else 8 + 32
+        return cell * (max_budget + 1) + n_items * ((max_budget >> 3) + 1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.estimate_nbytes(len(self.items), self.max_budget, self.engine)
+
+    def _check(self, budget: int) -> None:
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"Бюджет {budget} поза межами 0..{self.max_budget}")
+
+    def best_calories(self, budget: int) -> int:
+        """Максимум калорій при бюджеті budget за O(1)."""
+        self._check(budget)
+        return int(self._row[budget])
+
+    def solve(self, budget: int) -> Tuple[List[str], int, int]:
+        """(список_страв, сумарні_калорії, сумарна_вартість) для бюджету budget за O(n)."""
+        self._check(budget)
+        idx = _backtrack_bits(self.items, self._take, self._row_bytes, budget)
+        chosen = [self.items[i].name for i in idx]
+        return chosen, int(self._row[budget]), sum(self.items[i].cost for i in idx)
+
+
+# кеш розв'язувачів за вмістом меню (LRU)
+# Кожен запис тримає O(max_budget) пам'яті, тож кеш обмежений і кількістю записів, і сумарним
+# розміром таблиць; розв'язувач, більший за SOLVER_CACHE_BYTES, будується без кешування.
+SOLVER_CACHE_SIZE = 32
+SOLVER_CACHE_BYTES = 256 * 2 ** 20
+_solver_cache: "OrderedDict[tuple, KnapsackSolver]" = OrderedDict()
+
+
+def menu_key(items_dict: Dict[str, Dict[str, int]]) -> tuple:
+    """Ключ кешу: вміст меню з урахуванням порядку (він впливає на вибір серед рівних оптимумів)."""
+    return tuple((name, v["cost"], v["calories"]) for name, v in items_dict.items())
+
+
+def get_solver(items_dict: Dict[str, Dict[str, int]], max_budget: int) -> KnapsackSolver:
+    """
+    Повертає KnapsackSolver для меню з кешу або будує новий.
+    Якщо закешований розв'язувач покриває менший бюджет — перебудовую під більший.
+    Найдавніше використані меню витісняються, поки записів більше за SOLVER_CACHE_SIZE
+    або їхній сумарний розмір перевищує SOLVER_CACHE_BYTES.
+    Розв'язувач, що сам не вміщається в SOLVER_CACHE_BYTES, повертається некешованим.
+    """
+    key = menu_key(items_dict)
+    solver = _solver_cache.get(key)
+    if solver is not None and solver.max_budget >= max_budget:
+        _solver_cache.move_to_end(key)
+        return solver
+
+    if KnapsackSolver.estimate_nbytes(len(items_dict), max_budget) > SOLVER_CACHE_BYTES:
+        return KnapsackSolver(items_dict, max_budget)
+
+    _solver_cache.pop(key, None)  # меншу таблицю звільняю ще до побудови більшої
+    solver = KnapsackSolver(items_dict, max_budget)
+    _solver_cache[key] = solver
+    total = sum(s.nbytes for s in _solver_cache.values())
+    while len(_solver_cache) > SOLVER_CACHE_SIZE or total > SOLVER_CACHE_BYTES:
+        _, evicted = _solver_cache.popitem(last=False)
+        total -= evicted.nbytes
+    return solver
+
+
+def clear_solver_cache() -> None:
+    _solver_cache.clear()
+
+
+def solve_budgets(items_dict: Dict[str, Dict[str, int]], budgets) -> List[Tuple[List[str], int, int]]:
+    """Відповіді для багатьох бюджетів одного меню з однієї таблиці (у порядку budgets)."""
+    budgets = list(budgets)
+    if not budgets:
+        return []
+    solver = get_solver(items_dict, max(budgets))
+    return [solver.solve(b) for b in budgets]
+
+
+# Бенчмарк режимів ДП
+def random_menu(n: int, max_cost: int = 100, seed: int | None = 0) -> Dict[str, Dict[str, int]]:
+    """Випадкове меню з n страв (відтворюване при фіксованому seed)."""
+    import random
+
+    rng = random.Random(seed)
+    return {f"dish_{i}": {"cost": rng.randint(1, max_cost), "calories": rng.randint(1, 1000)}
+            for i in range(n)}
+
+
+def benchmark_dp(item_counts=(50, 200), budgets=(1_000, 10_000),
+                 modes=("table", "bitset", "numpy"), repeat=3) -> List[dict]:
+    """
+    Найкращий час із repeat для кожного режиму на випадкових меню.
+    Перевіряє, що всі режими повертають той самий результат, і рахує прискорення відносно "table".
+    """
+    import time
+
+    results = []
+    for n in item_counts:
+        menu = random_menu(n)
+        for budget in budgets:
+            reference = None
+            base_time = None
+            for mode in modes:
+                best = float("inf")
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    res = dynamic_programming(menu, budget, mode=mode)
+                    best = min(best, time.perf_counter() - t0)
+                if reference is None:
+                    reference, base_time = res, best
+                elif res != reference:
+                    raise AssertionError(f"Режим {mode!r} дав інший результат (n={n}, budget={budget})")
+                results.append({"n": n, "budget": budget, "mode": mode,
+                                "seconds": best, "speedup": base_time / best})
+    return results
+
+
 #  DEMO
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Вибір їжі: жадібний алгоритм vs ДП")
+    parser.add_argument("--bench", action="store_true", help="бенчмарк режимів ДП замість демо")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"{'n':>6} | {'Бюджет':>8} | {'Режим':>8} | {'Час, мс':>10} | {'Прискор.':>8}")
+        for r in benchmark_dp():
+            print(f"{r['n']:>6} | {r['budget']:>8} | {r['mode']:>8} | "
+                  f"{r['seconds'] * 1000:>10.2f} | {r['speedup']:>7.1f}x")
+        raise SystemExit(0)
+
     items = {
         "pizza": {"cost": 50, "calories": 300},
         "hamburger": {"cost": 40, "calories": 250},
@@ -17,14 +17,12 @@ python task_7.py --trials 300000 --seed 42  # фіксована випадко
 
 from __future__ import annotations
 
-import argparse
-import csv
 import math
-import random
 from collections import Counter
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+# matplotlib імпортується лише в save_plot, csv — у save_csv, random — у simulate, argparse — у main:
+# симуляція і метрики працюють без них, а `import task_7` лишається дешевим
 
 
 def analytic_probabilities() -> dict[int, float]:
@@ -41,6 +39,8 @@ def simulate(trials: int, seed: int | None = None) -> Counter[int]:
     Монте-Карло симуляція: кидаємо два кубики 'trials' разів.
     Повертаємо лічильник сум.
     """
+    import random
+
     if seed is not None:
         random.seed(seed)
     cnt = Counter()
@@ -76,6 +76,8 @@ def print_table(sim_p: dict[int, float], an_p: dict[int, float], counts: Counter
 
 def save_csv(path: Path, sim_p: dict[int, float], an_p: dict[int, float], counts: Counter[int], total: int) -> None:
     """Зберігає результати у CSV."""
+    import csv
+
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["sum", "count", "sim_probability", "analytic_probability", "abs_error"])
@@ -87,6 +89,8 @@ def save_csv(path: Path, sim_p: dict[int, float], an_p: dict[int, float], counts
 
 def save_plot(path: Path, sim_p: dict[int, float], an_p: dict[int, float]) -> None:
     """Будує та зберігає стовпчиковий графік."""
+    import matplotlib.pyplot as plt
+
     sums = list(range(2, 13))
     sim_vals = [sim_p[s] * 100 for s in sums]
     an_vals = [an_p[s] * 100 for s in sums]
@@ -126,6 +130,8 @@ def save_readme(path: Path, trials: int, mae: float, rmse: float, max_err: float
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Монте-Карло для двох кубиків")
     parser.add_argument("--trials", type=int, default=500_000, help="кількість кидків (default: 500000)")
     parser.add_argument("--seed", type=int, default=None, help="фіксований seed для відтворюваності")